@@ -5,8 +5,8 @@ Generate OpenAPI specification from FastAPI app.
 Usage:
     python scripts/generate_openapi.py [--output openapi.json]
 """
-import json
 import argparse
+import orjson
 from pathlib import Path
 import sys
 
@@ -23,14 +23,14 @@ def generate_openapi(output_path: str = "openapi.json"):
     Args:
         output_path: Path to save the OpenAPI JSON file.
     """
-    app = create_api()
+    # The admin dashboard is not part of the spec; skip the sqladmin import and mount
+    app = create_api(include_admin=False)
     openapi_schema = app.openapi()
     
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(openapi_schema, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(orjson.dumps(openapi_schema, option=orjson.OPT_INDENT_2))
     
     print(f"✓ OpenAPI specification generated: {output_file.absolute()}")
     print(f"  Title: {openapi_schema.get('info', {}).get('title')}")
@@ -2,12 +2,14 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import os
+import asyncio
 from loguru import logger
 from genpulse.infra.database.engine import init_db
 from genpulse import config
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from genpulse.infra.database.outbox import get_outbox
     # Startup: Initialize DB
     logger.info("Initializing database...")
     try:
@@ -15,10 +17,29 @@ async def lifespan(app: FastAPI):
         logger.info("Database initialized.")
     except Exception as e:
         logger.error(f"DB initialization failed: {e}")
+    # Background drain for task rows whose write-behind insert failed
+    outbox = get_outbox()
+    drainer = asyncio.create_task(outbox.run())
     yield
+    outbox.stop()
+    await drainer
+    await outbox.close()
+    # Shutdown: Stop the event stream reader and release Redis connections
+    from genpulse.infra.mq import get_mq
+    await get_mq().close()
+    from genpulse.clients.base import BaseClient
+    await BaseClient.close_http()
 
-def create_api() -> FastAPI:
-    """FastAPI Application Factory"""
+def create_api(include_admin: bool = True) -> FastAPI:
+    """
+    FastAPI Application Factory
+
+    Args:
+        include_admin: Mount the SQLAdmin dashboard. Schema generation turns this
+            off: the dashboard is not part of the OpenAPI spec, so importing
+            sqladmin and mounting it is wasted work. The DB engine is still
+            created, since the task router imports the database layer.
+    """
     app = FastAPI(title="GenPulse API", lifespan=lifespan)
     
     # 1. Mount static files
@@ -30,9 +51,10 @@ def create_api() -> FastAPI:
     app.include_router(task_router)
     
     # 3. Setup Admin Dashboard
-    from genpulse.infra.database.engine import engine
-    from genpulse.admin import init_admin
-    init_admin(app, engine)
+    if include_admin:
+        from genpulse.infra.database.engine import engine
+        from genpulse.admin import init_admin
+        init_admin(app, engine)
     
     # 4. Storage Router
     from genpulse.routers.storage import router as storage_router
@@ -50,29 +72,37 @@ def create_api() -> FastAPI:
         if not full:
             return status
 
+        from genpulse.infra.mq import get_mq
+        from genpulse.infra.mq.celery_app import celery_app
+
+        # Probe Redis/MQ and Celery workers concurrently; each is capped so a hung
+        # backend can't pin the endpoint
+        # ping() returns a list of dictionaries like [{'celery@worker1': {'ok': 'pong'}}]
+        redis_res, pongs = await asyncio.gather(
+            asyncio.wait_for(get_mq().ping(), timeout=2.0),
+            # Run blocking control command in thread
+            asyncio.wait_for(asyncio.to_thread(celery_app.control.ping, timeout=1.5), timeout=2.0),
+            return_exceptions=True
+        )
+
         details = {}
-        # 1. Check Redis/MQ
-        try:
-            from genpulse.infra.mq import get_mq
-            mq = get_mq()
-            await mq.ping()
-            details["redis"] = "ok"
-        except Exception as e:
-            details["redis"] = f"failed: {str(e)}"
+        # 1. Redis/MQ
+        if isinstance(redis_res, BaseException):
+            details["redis"] = f"failed: {str(redis_res) or type(redis_res).__name__}"
             status["status"] = "degraded"
+        elif not redis_res:
+            details["redis"] = "failed: broker unreachable"
+            status["status"] = "degraded"
+        else:
+            details["redis"] = "ok"
 
-        # 2. Check Celery Workers
-        try:
-            from genpulse.infra.mq.celery_app import celery_app
-            import asyncio
-            # Run blocking control command in thread
-            # ping() returns a list of dictionaries like [{'celery@worker1': {'ok': 'pong'}}]
-            pongs = await asyncio.to_thread(celery_app.control.ping, timeout=1.5)
+        # 2. Celery Workers
+        if isinstance(pongs, BaseException):
+            details["workers"] = f"check_failed: {str(pongs) or type(pongs).__name__}"
+            # Don't mark as degraded if just ping timeout, but maybe warning?
+        else:
             details["workers_online"] = len(pongs) if pongs else 0
             details["workers_raw"] = pongs
-        except Exception as e:
-            details["workers"] = f"check_failed: {str(e)}"
-            # Don't mark as degraded if just ping timeout, but maybe warning?
 
         status["details"] = details
         return status
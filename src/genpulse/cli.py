@@ -1,14 +1,38 @@
 import click
-import uvicorn
 import asyncio
+import atexit
 import logging
-from genpulse.app import create_api
-from genpulse.infra.database.engine import init_db as _init_db
+import os
+from typing import Optional
 
 from genpulse.infra.log import setup_logging
 
+# uvicorn, FastAPI (genpulse.app), SQLAlchemy and Celery are imported inside
+# the commands that need them, so `genpulse --help` and the lighter commands
+# don't pay for the whole server stack at startup.
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 logger = logging.getLogger("GenPulseCLI")
 
+# Event loop for uvicorn, pinned so a missing uvloop falls back visibly to asyncio
+UVICORN_LOOP = "uvloop" if uvloop else "asyncio"
+
+# Loop for one-shot commands, created on first use and closed at exit
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _run(coro):
+    """Run a coroutine on the process-wide CLI loop (uvloop where available)."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        atexit.register(_loop.close)
+    return _loop.run_until_complete(coro)
+
 @click.group()
 def cli():
     """GenPulse Management CLI"""
@@ -17,8 +41,9 @@ def cli():
 @cli.command()
 def init_db():
     """Initialize Database Tables"""
+    from genpulse.infra.database.engine import init_db as _init_db
     click.echo("Initializing Database...")
-    asyncio.run(_init_db())
+    _run(_init_db())
     click.echo("Database Initialized.")
 
 @cli.command()
@@ -27,77 +52,135 @@ def init_db():
 @click.option('--reload', is_flag=True, default=False)
 def api(host, port, reload):
     """Start the API Server"""
+    import uvicorn
     # Lifespan in FastAPI handles DB init
     if reload:
-        uvicorn.run("genpulse.app:create_api", host=host, port=port, reload=True, factory=True)
+        # The reloader imports the app in its own subprocess
+        uvicorn.run("genpulse.app:create_api", host=host, port=port, reload=True, factory=True, loop=UVICORN_LOOP)
     else:
+        from genpulse.app import create_api
         app = create_api()
-        uvicorn.run(app, host=host, port=port)
+        uvicorn.run(app, host=host, port=port, loop=UVICORN_LOOP)
 
 @cli.command()
-def worker():
+@click.option('--queues', '-Q', default=None, help='Comma-separated queues to consume (default: all priorities)')
+@click.option('--concurrency', '-c', type=int, default=None, help='Number of worker processes (default: from config, else CPU count)')
+def worker(queues, concurrency):
     """Start the Celery Worker Process"""
     click.echo("Starting Celery Worker...")
-    import subprocess
-    import sys
-    # Use subprocess to run celery
-    cmd = [sys.executable, "-m", "celery", "-A", "genpulse.infra.mq.celery_app", "worker", "--loglevel=info"]
-    try:
-        subprocess.run(cmd)
-    except KeyboardInterrupt:
-        pass
+    from genpulse.infra.mq.celery_app import celery_app, ALL_TASK_QUEUES
+    queues = queues or ",".join(ALL_TASK_QUEUES)
+    # Run celery in this interpreter instead of exec'ing a fresh one
+    argv = ["worker", "--loglevel=info", "-Q", queues]
+    if concurrency:
+        argv += ["-c", str(concurrency)]
+    celery_app.worker_main(argv=argv)
 
 @cli.command()
 @click.option('--port', default=5555, help='Port to run Flower on')
 def monitor(port):
     """Start Flower Dashboard for Real-time Monitoring"""
     click.echo(f"Starting Celery Flower on http://localhost:{port}")
-    import subprocess
-    import sys
-    # celery -A genpulse.infra.mq.celery_app flower --port=5555
-    cmd = [
-        sys.executable, "-m", "celery", 
-        "-A", "genpulse.infra.mq.celery_app", 
-        "flower", 
-        f"--port={port}"
-    ]
-    try:
-        subprocess.run(cmd)
-    except KeyboardInterrupt:
-        pass
+    # celery -A genpulse.infra.mq.celery_app flower --port=5555, without a new interpreter
+    from genpulse.infra.mq.celery_app import celery_app
+    celery_app.start(argv=["flower", f"--port={port}"])
 
 @cli.command()
-def dev():
+@click.option('--reload/--no-reload', default=True, help='Auto-reload the API on code changes. With --no-reload the API runs inside this process instead of a separate interpreter.')
+def dev(reload):
     """Start API and Worker in a combined process (recommended for Local Dev)"""
     click.echo("Starting GenPulse in Development Mode (API + Celery)...")
-    import subprocess
     import sys
+    # No DB init here: the API lifespan does it on startup, inside the server's own loop
     
-    # 1. Ensure DB (run async in sync context)
-    asyncio.run(_init_db())
-    
-    # 2. Start Processes
-    # API
-    api_cmd = [sys.executable, "-m", "uvicorn", "genpulse.app:create_api", "--host", "0.0.0.0", "--port", "8000", "--reload", "--factory"]
-    api_proc = subprocess.Popen(api_cmd)
-    
-    # Worker
-    worker_cmd = [sys.executable, "-m", "celery", "-A", "genpulse.infra.mq.celery_app", "worker", "--loglevel=info"]
-    worker_proc = subprocess.Popen(worker_cmd)
+    # Worker (Celery runs its own process pool, so it always gets a child process)
+    from genpulse.infra.mq.celery_app import ALL_TASK_QUEUES
+    worker_cmd = [sys.executable, "-m", "celery", "-A", "genpulse.infra.mq.celery_app", "worker", "--loglevel=info", "-Q", ",".join(ALL_TASK_QUEUES)]
+    worker_proc = _spawn(worker_cmd)
+
+    if not reload:
+        # API in-process: uvicorn handles Ctrl-C and returns, then the worker is stopped
+        import uvicorn
+        from genpulse.app import create_api
+        click.echo(f"Services started. API: {os.getpid()} (in-process), Worker: {worker_proc.pid}")
+        try:
+            uvicorn.run(create_api(), host="0.0.0.0", port=8000, loop=UVICORN_LOOP)
+        finally:
+            _stop_processes(worker_proc)
+        return
+
+    # API (the reloader needs its own process)
+    api_cmd = [sys.executable, "-m", "uvicorn", "genpulse.app:create_api", "--host", "0.0.0.0", "--port", "8000", "--reload", "--factory", "--loop", UVICORN_LOOP]
+    api_proc = _spawn(api_cmd)
     
     click.echo(f"Services started. API: {api_proc.pid}, Worker: {worker_proc.pid}")
     
+    import signal
+    # SIGTERM unwinds like Ctrl-C so both children are always stopped together
+    signal.signal(signal.SIGTERM, _raise_interrupt)
     try:
-        api_proc.wait()
-        worker_proc.wait()
+        # If either service exits, take the other one down with it
+        exited = _wait_any(api_proc, worker_proc)
+        click.echo(f"Process {exited.pid} exited with code {exited.returncode}, stopping services...")
     except KeyboardInterrupt:
         click.echo("\nStopping services...")
-        api_proc.terminate()
-        worker_proc.terminate()
     except Exception as e:
         click.echo(f"Error: {e}")
-        api_proc.terminate()
-        worker_proc.terminate()
+    finally:
+        _stop_processes(api_proc, worker_proc)
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+def _wait_any(*procs, interval: float = 0.5):
+    """Block until one of the child processes exits and return it."""
+    import time
+    while True:
+        for proc in procs:
+            if proc.poll() is not None:
+                return proc
+        time.sleep(interval)
+
+def _set_pdeathsig():
+    """Have the kernel SIGTERM the child if this CLI process dies (Linux only)."""
+    import ctypes
+    import signal
+    PR_SET_PDEATHSIG = 1
+    try:
+        ctypes.CDLL("libc.so.6", use_errno=True).prctl(PR_SET_PDEATHSIG, signal.SIGTERM, 0, 0, 0)
+    except OSError:
+        pass
+
+def _spawn(cmd):
+    """
+    Start a child in its own process group.
+
+    The whole group (uvicorn's reloader, Celery's pool processes, ...) can then
+    be signalled at once, and on Linux it is torn down even if we crash.
+    """
+    import subprocess
+    import sys
+    preexec_fn = _set_pdeathsig if sys.platform.startswith("linux") else None
+    return subprocess.Popen(cmd, start_new_session=True, preexec_fn=preexec_fn)
+
+def _signal_group(proc, sig):
+    try:
+        os.killpg(proc.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+def _stop_processes(*procs, timeout: float = 10.0):
+    """Terminate child process groups and reap them so none are left behind as zombies."""
+    import signal
+    import subprocess
+    for proc in procs:
+        _signal_group(proc, signal.SIGTERM)
+    for proc in procs:
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _signal_group(proc, signal.SIGKILL)
+            proc.wait()
 
 if __name__ == "__main__":
     cli()
@@ -1,13 +1,14 @@
 import asyncio
 from loguru import logger
+import hashlib
+import hmac
 import os
 import time
-import datetime
 import httpx
-from typing import Optional, Dict, Any, Union, Callable
-from baidubce.auth import bce_v1_signer
-from baidubce.http import http_methods, bce_http_client
-from baidubce.http import http_headers
+import orjson
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Union, Callable
+from urllib.parse import quote
 
 from genpulse.clients.base import BaseClient
 from .schemas import (
@@ -26,6 +27,93 @@ from .schemas import (
 )
 
 
+@lru_cache(maxsize=64)
+def _submit_prefix(model: str) -> bytes:
+    """
+    JSON envelope head for a submit body: {"model":"<m>","model<m>TaskInput":
+
+    Baidu requires inputs in a specific key based on model, e.g. "modelK25TTaskInput".
+    """
+    return b'{"model":%s,%s:' % (orjson.dumps(model), orjson.dumps(f"model{model}TaskInput"))
+
+
+class _StatusBatcher:
+    """
+    Coalesces concurrent get_task() polls into one list_tasks() call.
+
+    A poll made while no other poll is in flight goes straight to get_task(),
+    so a lone poller pays no extra latency. A poll that overlaps others opens
+    a short window; every task polled during it is looked up in a single
+    signed list request. Tasks missing from that page (older ones) fall back
+    to an individual get_task().
+    """
+
+    def __init__(self, client: "BaiduVodClient", window: float = 0.5, page_size: int = 100):
+        self.client = client
+        self.window = window
+        self.page_size = page_size
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._direct = 0
+
+    async def get(self, task_id: str) -> BaiduStatusResponse:
+        if self._flusher is None and not self._direct:
+            self._direct += 1
+            try:
+                return await self.client.get_task(task_id)
+            finally:
+                self._direct -= 1
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(task_id, []).append(future)
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self):
+        await asyncio.sleep(self.window)
+        waiters, self._waiters = self._waiters, {}
+        self._flusher = None
+
+        found: Dict[str, BaiduStatusResponse] = {}
+        if len(waiters) > 1:
+            try:
+                listing = await self.client._list_tasks_raw(pn=1, ps=self.page_size)
+                # Validate only the entries someone is waiting for, not the whole page
+                found = {
+                    task["taskId"]: BaiduStatusResponse.model_validate(task)
+                    for task in listing.get("tasks", [])
+                    if task.get("taskId") in waiters
+                }
+            except Exception as e:
+                logger.warning(f"Baidu: batched status query failed, polling individually: {e}")
+
+        async def resolve(task_id: str, futures: List[asyncio.Future]):
+            try:
+                result = found[task_id] if task_id in found else await self.client.get_task(task_id)
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+        await asyncio.gather(*(resolve(tid, futures) for tid, futures in waiters.items()))
+
+
+_SIGN_EXPIRATION = 1800
+_SIGNED_HEADERS = "host;x-bce-date"
+
+def _uri_encode(value: str) -> str:
+    """RFC 3986 encoding used by BCE canonical requests."""
+    return quote(value, safe="-_.~")
+
+@lru_cache(maxsize=256)
+def _canonical_prefix(method: str, path: str) -> str:
+    """Method and URI lines of the canonical request, cached per endpoint."""
+    return f"{method.upper()}\n{quote(path, safe='/-_.~')}\n"
+
 class BaiduVodClient(BaseClient):
     """
     Baidu Cloud VOD AIGC Video Client.
@@ -48,26 +136,58 @@ class BaiduVodClient(BaseClient):
         if not self.ak or not self.sk:
             raise ValueError("Baidu AK and SK are required for authentication.")
 
-    def _get_auth_header(self, method: str, path: str, params: Dict[str, str], headers: Dict[str, str]) -> str:
-        """Generate BCE-AUTH-V1 signature"""
-        timestamp = int(time.time())
-        # Baidu SDK expects a credentials object or similar, but we can use the signer directly
-        # Format: bce-auth-v1/{accessKeyId}/{timestamp}/{expirationPeriodInSeconds}/{signedHeaders}/{signature}
-        
-        # We'll use a simplified version of signing or the SDK signer if easy
-        # Actually, manually creating the canonical request is better for async httpx
-        return bce_v1_signer.sign(self.ak, self.sk, method, path, headers, params)
+        self._status_batcher = _StatusBatcher(self)
+
+        # x-bce-date and the derived signing key only change once a second;
+        # concurrent requests share both
+        self._date_ts = 0
+        self._bce_date = ""
+        self._auth_prefix = ""
+        self._signing_key = b""
+        self._canonical_host = "host:" + _uri_encode(self.host)
+
+    def _get_bce_date(self) -> str:
+        """Current UTC time formatted as x-bce-date, memoized per second."""
+        ts = int(time.time())
+        if ts != self._date_ts:
+            self._bce_date = "%04d-%02d-%02dT%02d:%02d:%02dZ" % time.gmtime(ts)[:6]
+            self._auth_prefix = f"bce-auth-v1/{self.ak}/{self._bce_date}/{_SIGN_EXPIRATION}"
+            self._signing_key = hmac.new(
+                self.sk.encode(), self._auth_prefix.encode(), hashlib.sha256
+            ).hexdigest().encode()
+            self._date_ts = ts
+        return self._bce_date
+
+    def _get_auth_header(self, method: str, path: str, params: Dict[str, Any], bce_date: str) -> str:
+        """
+        Generate the BCE-AUTH-V1 Authorization header.
+        Format: bce-auth-v1/{ak}/{timestamp}/{expiration}/{signedHeaders}/{signature}
+
+        Only host and x-bce-date are signed. The signing key comes from
+        _get_bce_date() and the method/URI lines from _canonical_prefix(), so
+        each request only encodes its query and date and runs one HMAC.
+        """
+        query = "&".join(sorted(
+            f"{_uri_encode(str(k))}={_uri_encode(str(v))}"
+            for k, v in params.items() if k.lower() != "authorization"
+        ))
+        canonical_request = (
+            f"{_canonical_prefix(method, path)}{query}\n"
+            f"{self._canonical_host}\nx-bce-date:{_uri_encode(bce_date)}"
+        )
+        signature = hmac.new(self._signing_key, canonical_request.encode(), hashlib.sha256).hexdigest()
+        return f"{self._auth_prefix}/{_SIGNED_HEADERS}/{signature}"
 
     async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
         """Override _request to include Baidu BCE authentication"""
         headers = kwargs.get("headers", {}).copy()
         headers["Host"] = self.host
-        headers["x-bce-date"] = datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+        headers["x-bce-date"] = bce_date = self._get_bce_date()
         
         query_params = kwargs.get("params", {})
         
         # Generate signature
-        auth = self._get_auth_header(method, path, query_params, headers)
+        auth = self._get_auth_header(method, path, query_params, bce_date)
         headers["Authorization"] = auth
         
         kwargs["headers"] = headers
@@ -78,9 +198,9 @@ class BaiduVodClient(BaseClient):
 
     async def get_task(self, task_id: str) -> BaiduStatusResponse:
         """Query the status of an AIGC task (Video or Image)"""
-        logger.info(f"Baidu: Querying task {task_id}")
+        logger.debug("Baidu: Querying task {}", task_id)
         data = await self._request("GET", f"/v2/aigc/task/{task_id}")
-        return BaiduStatusResponse(**data)
+        return BaiduStatusResponse.model_validate(data)
 
     async def list_tasks(
         self, 
@@ -88,10 +208,12 @@ class BaiduVodClient(BaseClient):
         ps: int = 20
     ) -> BaiduTaskListResponse:
         """Query the list of AIGC tasks"""
-        logger.info(f"Baidu: Listing tasks (Page: {pn}, Size: {ps})")
-        params = {"pn": pn, "ps": ps}
-        data = await self._request("GET", "/v2/aigc/task", params=params)
-        return BaiduTaskListResponse(**data)
+        logger.debug("Baidu: Listing tasks (Page: {}, Size: {})", pn, ps)
+        return BaiduTaskListResponse.model_validate(await self._list_tasks_raw(pn, ps))
+
+    async def _list_tasks_raw(self, pn: int, ps: int) -> Dict[str, Any]:
+        """Unvalidated list_tasks() payload, for callers that only need a few entries."""
+        return await self._request("GET", "/v2/aigc/task", params={"pn": pn, "ps": ps})
 
     async def text_to_video(
         self, 
@@ -356,19 +478,20 @@ class BaiduVodClient(BaseClient):
         **kwargs
     ) -> BaiduStatusResponse:
         """Shared logic for all Baidu AIGC tasks"""
-        request = params if isinstance(params, params_model) else params_model(**params)
+        request = params if isinstance(params, params_model) else params_model.model_validate(params)
         
-        # Baidu requires inputs in a specific key based on model, e.g. "modelK25TTaskInput"
-        input_key = f"model{request.model}TaskInput"
-        payload = {
-            "model": request.model,
-            input_key: request.taskInput.model_dump(exclude_none=True)
-        }
+        # Serialize taskInput straight to JSON and splice it into the envelope, so a
+        # multi-MB base64 image is not walked into a dict and then encoded again
+        body = b"%s%s}" % (
+            _submit_prefix(request.model),
+            request.taskInput.model_dump_json(exclude_none=True).encode()
+        )
+        headers = {**kwargs.pop("headers", {}), "Content-Type": "application/json"}
         
         logger.info(f"Baidu: Submitting task to {endpoint} (Model: {request.model})")
-        # Pass kwargs (like headers, timeout) to the underlying _request
-        data = await self._request("POST", endpoint, json=payload, **kwargs)
-        init_resp = BaiduAigcResponse(**data)
+        # Pass kwargs (like timeout) to the underlying _request
+        data = await self._request("POST", endpoint, content=body, headers=headers, **kwargs)
+        init_resp = BaiduAigcResponse.model_validate(data)
         
         task_id = init_resp.taskId
         
@@ -377,7 +500,8 @@ class BaiduVodClient(BaseClient):
 
         return await self.poll_task(
             task_id=task_id,
-            get_status_func=self.get_task,
+            # Concurrent waits on this client share one list request per round
+            get_status_func=self._status_batcher.get,
             check_success_func=lambda resp: resp.is_succeeded,
             check_failed_func=lambda resp: resp.is_finished and not resp.is_succeeded,
             callback=callback,
@@ -1,5 +1,14 @@
+import base64
 from typing import Optional, List, Literal, Any, Dict, Union
-from pydantic import BaseModel, Field, ConfigDict
+from typing_extensions import Annotated
+from pydantic import BaseModel, Field, ConfigDict, PlainSerializer
+
+def _encode_image(value: Union[str, bytes]) -> str:
+    return base64.b64encode(value).decode("ascii") if isinstance(value, (bytes, bytearray)) else value
+
+# URL/Base64 string, or raw image bytes that are base64-encoded only when the
+# request body is serialized (callers skip building their own base64 copy)
+ImageData = Annotated[Union[str, bytes], PlainSerializer(_encode_image, return_type=str, when_used="json")]
 
 # --- Common Components ---
 
@@ -20,8 +29,8 @@ class BaiduAigcImageInput(BaiduAigcBaseInput):
     """
     Input fields specific to Image-to-Video tasks.
     """
-    image: str = Field(..., description="Source image URL or Base64")
-    imageTail: Optional[str] = Field(None, description="Optional ending frame image")
+    image: ImageData = Field(..., description="Source image URL, Base64 or raw bytes")
+    imageTail: Optional[ImageData] = Field(None, description="Optional ending frame image")
 
 # --- Request Schemas ---
 
@@ -86,7 +95,7 @@ class BaiduImageInput(BaiduAigcBaseInput):
     seed: Optional[int] = Field(None, description="Random seed")
     style: Optional[str] = Field(None, description="Image style preset")
     # For image-to-image
-    image: Optional[str] = Field(None, description="Source image (URL or Base64)")
+    image: Optional[ImageData] = Field(None, description="Source image (URL, Base64 or raw bytes)")
     strength: Optional[float] = Field(0.75, description="Denoising strength")
 
 class BaiduTextToImageParams(BaseModel):
@@ -152,7 +161,7 @@ class BaiduStatusResponse(BaseModel):
     
     @property
     def is_finished(self) -> bool:
-        return self.status in ["SUCCESS", "FAILED"]
+        return self.status in {"SUCCESS", "FAILED"}
 
     @property
     def is_succeeded(self) -> bool:
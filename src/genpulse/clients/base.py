@@ -1,24 +1,86 @@
 import asyncio
+import random
 import httpx
-from typing import Any, Callable, Optional, TypeVar, Coroutine, Dict
+import orjson
+from typing import Any, Callable, Optional, TypeVar, Coroutine, Dict, List
 from loguru import logger
+from pydantic import BaseModel
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 T = TypeVar("T")
 
+_NO_HEADERS: Dict[str, str] = {}
+
 class BaseClient:
     """
     Abstract base client providing common utilities for async task polling and HTTP requests.
     """
+    # One keep-alive connection pool shared by every provider client, so status
+    # polls reuse open TLS connections and, over HTTP/2, concurrent requests to
+    # one provider share a single connection. httpx pools are bound to the loop
+    # that created them.
+    _http: Optional[httpx.AsyncClient] = None
+    _http_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _get_http() -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        http = BaseClient._http
+        if http is None or http.is_closed or BaseClient._http_loop is not loop:
+            http = BaseClient._http = httpx.AsyncClient(
+                # Keep idle connections longer than the slowest poll interval
+                # (httpx's default 5 s would reconnect on nearly every poll)
+                limits=httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=75),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                http2=_HTTP2
+            )
+            BaseClient._http_loop = loop
+        return http
+
+    @staticmethod
+    async def close_http():
+        """Close the shared connection pool (on worker/app shutdown)."""
+        if BaseClient._http is not None:
+            await BaseClient._http.aclose()
+        BaseClient._http = None
+        BaseClient._http_loop = None
 
     def __init__(self, base_url: str = ""):
         self.base_url = base_url.rstrip('/') if base_url else ""
 
+    @staticmethod
+    def _dump_nonnull(model: BaseModel) -> Dict[str, Any]:
+        """
+        Equivalent of model.model_dump(exclude_none=True) for request models.
+
+        Reads field values (and allowed extras) straight off the instance
+        instead of running the pydantic serializer; nested models and lists
+        of models are converted the same way.
+        """
+        data = {k: v for k, v in model.__dict__.items() if v is not None}
+        if model.__pydantic_extra__:
+            data.update((k, v) for k, v in model.__pydantic_extra__.items() if v is not None)
+        for k, v in data.items():
+            if isinstance(v, BaseModel):
+                data[k] = BaseClient._dump_nonnull(v)
+            elif isinstance(v, list) and v and isinstance(v[0], BaseModel):
+                data[k] = [BaseClient._dump_nonnull(item) for item in v]
+        return data
+
     def _get_headers(self) -> Dict[str, str]:
         """
         Default header provider for _request. Subclasses can override this 
         to provide dynamic headers (e.g., JWT tokens).
+
+        The returned dict is treated as read-only, so implementations may
+        return the same cached dict on every call.
         """
-        return {}
+        return _NO_HEADERS
 
     async def _request(
         self, 
@@ -42,19 +104,40 @@ class BaseClient:
         Returns:
             The JSON response as a dictionary.
         """
+        return orjson.loads(await self._request_raw(method, path, headers=headers, timeout=timeout, **kwargs))
+
+    async def _request_raw(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+        **kwargs
+    ) -> bytes:
+        """
+        Same as _request(), but returns the undecoded response body.
+
+        Lets callers parse straight into a response model with
+        Model.model_validate_json(), skipping the intermediate dict.
+        """
         # 1. Prepare URL
         url = path if path.startswith("http") else f"{self.base_url}{path}"
         
-        # 2. Prepare Headers
+        # 2. Prepare Headers (the provider's dict is shared, only copy to extend it)
         request_headers = self._get_headers()
         if headers:
-            request_headers.update(headers)
+            request_headers = {**request_headers, **headers}
             
-        # 3. Perform Request
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(method, url, headers=request_headers, **kwargs)
-            response.raise_for_status()
-            return response.json()
+        # Encode JSON bodies with orjson; payloads can carry multi-MB base64 images
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            if "Content-Type" not in request_headers:
+                request_headers = {**request_headers, "Content-Type": "application/json"}
+
+        # 3. Perform Request on the shared pool
+        response = await self._get_http().request(method, url, headers=request_headers, timeout=timeout, **kwargs)
+        response.raise_for_status()
+        return response.content
 
     async def poll_task(
         self, 
@@ -64,7 +147,9 @@ class BaseClient:
         check_failed_func: Callable[[Any], bool],
         callback: Optional[Callable[[Any], Coroutine[Any, Any, None]]] = None,
         interval: int = 2,
-        timeout: int = 300
+        timeout: int = 300,
+        initial_interval: float = 1.0,
+        max_consecutive_errors: int = 5
     ) -> Any:
         """
         Generic polling mechanism for async long-running tasks.
@@ -75,23 +160,33 @@ class BaseClient:
             check_success_func: Function to determine if task succeeded from response.
             check_failed_func: Function to determine if task failed from response.
             callback: Optional async callback triggered on each poll cycle.
-            interval: Seconds to wait between retries.
+            interval: Maximum seconds to wait between retries.
             timeout: Maximum seconds to wait before raising TimeoutError.
+            initial_interval: First wait; doubles each cycle up to `interval`,
+                so short tasks are noticed quickly without hammering long ones.
+            max_consecutive_errors: Give up after this many status queries in a
+                row have failed (throttled queries don't count).
             
         Returns:
             The final response object when successful or failed.
             
         Raises:
             TimeoutError: If timeout is reached.
+            Exception: The last error, if it is not retryable (e.g. HTTP 401)
+                or max_consecutive_errors was reached.
         """
         logger.info(f"Starting polling for task: {task_id} (timeout={timeout}s)")
         
-        start_time = asyncio.get_running_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = min(initial_interval, interval)
+        errors = 0
         
-        while (asyncio.get_running_loop().time() - start_time) < timeout:
+        while loop.time() < deadline:
             try:
                 # 1. Fetch current status
                 response = await get_status_func(task_id)
+                errors = 0
                 
                 # 2. Trigger optional callback
                 if callback:
@@ -107,13 +202,115 @@ class BaseClient:
                     return response
                 
                 # 4. Wait for next cycle
-                await asyncio.sleep(interval)
+                await asyncio.sleep(self._jitter(delay))
+                delay = min(delay * 2, interval)
                 
             except Exception as e:
                 logger.error(f"Error during polling for task {task_id}: {e}")
-                # Optional: decide whether to break or continue on transient errors
-                # For now, we continue to be robust
-                await asyncio.sleep(interval)
+                retry_after = self._retry_after(e)
+                if retry_after is not None:
+                    # Throttled: wait as long as the provider asks, not our own schedule
+                    await asyncio.sleep(retry_after)
+                    continue
+                # Transient errors (network, 5xx, SDK hiccups) are retried, but
+                # not forever, and not at all when retrying can't help
+                errors += 1
+                if errors >= max_consecutive_errors or self._is_fatal(e):
+                    raise
+                await asyncio.sleep(self._jitter(delay))
+                delay = min(delay * 2, interval)
         
         raise TimeoutError(f"Task {task_id} timed out after {timeout} seconds.")
 
+    async def poll_tasks(
+        self,
+        task_ids: List[str],
+        get_status_func: Callable[[str], Coroutine[Any, Any, Any]],
+        check_success_func: Callable[[Any], bool],
+        check_failed_func: Callable[[Any], bool],
+        callback: Optional[Callable[[Any], Coroutine[Any, Any, None]]] = None,
+        interval: int = 2,
+        timeout: int = 300,
+        initial_interval: float = 1.0,
+        max_consecutive_errors: int = 5
+    ) -> Dict[str, Any]:
+        """
+        poll_task() for many tasks at once.
+
+        All unfinished tasks share one wait schedule and are queried together
+        each round, instead of each running its own sleep/fetch loop. A failed
+        status query only retries that task on the next round; errors are
+        limited per task exactly as in poll_task().
+
+        Returns:
+            Final response per task ID.
+
+        Raises:
+            TimeoutError: If any task is still unfinished when timeout is reached.
+            Exception: A task's last error, if it is not retryable or that task
+                reached max_consecutive_errors.
+        """
+        logger.info(f"Starting polling for {len(task_ids)} tasks (timeout={timeout}s)")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = min(initial_interval, interval)
+        pending = list(dict.fromkeys(task_ids))
+        results: Dict[str, Any] = {}
+        errors: Dict[str, int] = {}
+
+        while loop.time() < deadline:
+            responses = await asyncio.gather(
+                *(get_status_func(task_id) for task_id in pending), return_exceptions=True
+            )
+            still_pending = []
+            for task_id, response in zip(pending, responses):
+                if isinstance(response, Exception):
+                    logger.error(f"Error during polling for task {task_id}: {response}")
+                    if self._retry_after(response) is None:
+                        errors[task_id] = errors.get(task_id, 0) + 1
+                        if errors[task_id] >= max_consecutive_errors or self._is_fatal(response):
+                            raise response
+                    still_pending.append(task_id)
+                    continue
+                errors.pop(task_id, None)
+                if callback:
+                    await callback(response)
+                if check_success_func(response) or check_failed_func(response):
+                    results[task_id] = response
+                else:
+                    still_pending.append(task_id)
+
+            pending = still_pending
+            if not pending:
+                return results
+
+            await asyncio.sleep(self._jitter(delay))
+            delay = min(delay * 2, interval)
+
+        raise TimeoutError(f"Tasks {pending} timed out after {timeout} seconds.")
+
+    @staticmethod
+    def _jitter(delay: float) -> float:
+        """Spread polls by up to +25% so concurrent tasks don't poll in lockstep."""
+        return delay + random.uniform(0, 0.25 * delay)
+
+    @staticmethod
+    def _is_fatal(error: Exception) -> bool:
+        """Client errors (bad auth, unknown task, ...) that won't change on retry."""
+        return (
+            isinstance(error, httpx.HTTPStatusError)
+            and 400 <= error.response.status_code < 500
+            and error.response.status_code not in (408, 429)
+        )
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Seconds from a Retry-After header on a 429/503 response, if given."""
+        if not isinstance(error, httpx.HTTPStatusError) or error.response.status_code not in (429, 503):
+            return None
+        try:
+            return max(float(error.response.headers["Retry-After"]), 0.0)
+        except (KeyError, ValueError):
+            # Missing, or the HTTP-date form; fall back to the backoff schedule
+            return None
@@ -1,65 +1,98 @@
 import asyncio
-import json
+import orjson
 import uuid
 import httpx
 import websockets
 from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
 from loguru import logger
 
+def make_http_pool() -> httpx.AsyncClient:
+    """Keep-alive connection pool for one ComfyUI server; safe to share between clients."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=75)
+    )
+
 class ComfyClient:
-    def __init__(self, base_url: str = "http://127.0.0.1:8188"):
+    """
+    Client for one ComfyUI session.
+
+    ComfyUI keeps a single websocket per clientId, so each task should use its
+    own ComfyClient (and therefore its own client_id). Pass a shared `http` pool
+    so those short-lived clients still reuse keep-alive connections.
+    """
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8188", http: Optional[httpx.AsyncClient] = None):
         self.base_url = base_url.rstrip("/")
         self.client_id = str(uuid.uuid4())
         
-        # Parse host for websocket
-        # Simplistic parsing, robust code would use urllib.parse
-        if "://" in self.base_url:
-            self.host = self.base_url.split("://")[1]
-        else:
-            self.host = self.base_url
+        # Websocket endpoint mirrors base_url: same host and path prefix, wss for https
+        parts = urlsplit(self.base_url if "://" in self.base_url else f"http://{self.base_url}")
+        self.host = parts.netloc
+        ws_scheme = "wss" if parts.scheme == "https" else "ws"
+
+        # Endpoint URLs are fixed per client
+        self._ws_url = f"{ws_scheme}://{self.host}{parts.path}/ws?clientId={self.client_id}"
+        self._prompt_url = f"{self.base_url}/prompt"
+        self._history_url_prefix = f"{self.base_url}/history/"
+        self._view_url = f"{self.base_url}/view"
+
+        # A shared pool is owned by the caller; otherwise the client builds its own
+        self._http = http
+        self._owns_http = http is None
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = make_http_pool()
+            self._owns_http = True
+        return self._http
+
+    async def aclose(self):
+        if self._http is not None and self._owns_http:
+            await self._http.aclose()
+        self._http = None
 
     async def queue_prompt(self, prompt: Dict[str, Any]) -> str:
-        url = f"{self.base_url}/prompt"
-        payload = {"prompt": prompt, "client_id": self.client_id}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            return data["prompt_id"]
+        payload = orjson.dumps({"prompt": prompt, "client_id": self.client_id})
+        response = await self.http.post(self._prompt_url, content=payload, headers={"Content-Type": "application/json"})
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data["prompt_id"]
 
     async def get_history(self, prompt_id: str) -> Dict[str, Any]:
-        url = f"{self.base_url}/history/{prompt_id}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.json()
+        response = await self.http.get(self._history_url_prefix + prompt_id)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def get_image(self, filename: str, subfolder: str, folder_type: str) -> bytes:
-        url = f"{self.base_url}/view"
         params = {
             "filename": filename,
             "subfolder": subfolder,
             "type": folder_type
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.content
+        response = await self.http.get(self._view_url, params=params)
+        response.raise_for_status()
+        return response.content
 
-    async def wait_for_completion(self, prompt_id: str) -> List[bytes]:
+    async def wait_for_completion(self, prompt_id: str, timeout: Optional[float] = None) -> List[bytes]:
         """
         Connect to WS and wait for the specific prompt_id execution to finish.
         Returns a list of image bytes.
+
+        Raises:
+            TimeoutError: The prompt did not finish within `timeout` seconds.
         """
-        ws_url = f"ws://{self.host}/ws?clientId={self.client_id}"
-        images = []
-        
         try:
-            async with websockets.connect(ws_url) as ws:
+            async with asyncio.timeout(timeout), websockets.connect(self._ws_url) as ws:
                 while True:
                     out = await ws.recv()
                     if isinstance(out, str):
-                        message = json.loads(out)
+                        # Most frames are progress/status; only decode "executing"
+                        # frames that mention this prompt
+                        if '"executing"' not in out or prompt_id not in out:
+                            continue
+                        message = orjson.loads(out)
                         if message['type'] == 'executing':
                             data = message['data']
                             if data['node'] is None and data['prompt_id'] == prompt_id:
@@ -72,18 +105,13 @@ class ComfyClient:
             # After breaking, get history to find output filenames
             history = await self.get_history(prompt_id)
             outputs = history[prompt_id]['outputs']
-            for node_id in outputs:
-                node_output = outputs[node_id]
-                if 'images' in node_output:
-                    for image in node_output['images']:
-                        img_bytes = await self.get_image(
-                            image['filename'], 
-                            image['subfolder'], 
-                            image['type']
-                        )
-                        images.append(img_bytes)
-            
-            return images
+            jobs = [
+                (image['filename'], image['subfolder'], image['type'])
+                for node_output in outputs.values()
+                for image in node_output.get('images', [])
+            ]
+            # Download all outputs concurrently over the pooled client, in history order
+            return list(await asyncio.gather(*(self.get_image(f, s, t) for f, s, t in jobs)))
         except Exception as e:
             logger.error(f"Error waiting for ComfyUI task {prompt_id}: {e}")
             raise
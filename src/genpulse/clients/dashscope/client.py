@@ -1,7 +1,9 @@
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 import os
-from typing import Optional, Dict, Any, Union, Callable
+from typing import Optional, Dict, Any, List, Union, Callable
 import dashscope
 from dashscope import ImageSynthesis, MultiModalConversation, VideoSynthesis
 from genpulse.clients.base import BaseClient
@@ -9,9 +11,26 @@ from .schemas import (
     DashScopeImageParams,
     DashScopeImageEditParams,
     DashScopeVideoParams,
+    DashScopeImageItem,
     DashScopeStatusResponse
 )
 
+# The DashScope SDK is blocking. Its calls get their own bounded pool so a burst
+# of concurrent polls doesn't queue behind (or starve) other to_thread users on
+# the loop's default executor. Created lazily, i.e. after the worker has forked.
+SDK_MAX_WORKERS = 16
+_SDK_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+def _sdk_executor() -> ThreadPoolExecutor:
+    global _SDK_EXECUTOR
+    if _SDK_EXECUTOR is None:
+        _SDK_EXECUTOR = ThreadPoolExecutor(max_workers=SDK_MAX_WORKERS, thread_name_prefix="dashscope")
+    return _SDK_EXECUTOR
+
+async def _run_sdk(func, /, **kwargs):
+    """Run a blocking SDK call on the shared DashScope pool."""
+    return await asyncio.get_running_loop().run_in_executor(_sdk_executor(), functools.partial(func, **kwargs))
+
 
 class DashScopeClient(BaseClient):
     """
@@ -34,7 +53,7 @@ class DashScopeClient(BaseClient):
     async def get_task_status(self, task_id: str) -> DashScopeStatusResponse:
         """Fetch the current status of the synthesis task"""
         # SDK allows fetching by task_id or the original response object
-        response = await asyncio.to_thread(
+        response = await _run_sdk(
             ImageSynthesis.fetch,
             task=task_id
         )
@@ -48,9 +67,10 @@ class DashScopeClient(BaseClient):
         results = []
         if task_status == "SUCCEEDED":
             raw_results = output.get("results", [])
-            results = [{"url": r.get("url")} for r in raw_results]
+            results = [DashScopeImageItem.model_construct(url=r.get("url")) for r in raw_results]
 
-        return DashScopeStatusResponse(
+        # The SDK has already parsed the response; build the model without re-validating it
+        return DashScopeStatusResponse.model_construct(
             task_id=task_id,
             task_status=task_status,
             results=results,
@@ -81,8 +101,8 @@ class DashScopeClient(BaseClient):
             DashScopeStatusResponse: Final status of the task.
         """
         # 1. Prepare request
-        request = DashScopeImageParams(**params) if isinstance(params, dict) else params
-        request_data = request.model_dump(exclude_none=True)
+        request = DashScopeImageParams.model_validate(params) if isinstance(params, dict) else params
+        request_data = self._dump_nonnull(request)
         
         # Extract core fields for SDK call
         model = request_data.pop("model")
@@ -94,7 +114,7 @@ class DashScopeClient(BaseClient):
         sdk_args = {**request_data, **kwargs}
         
         # 2. Async Submission
-        response = await asyncio.to_thread(
+        response = await _run_sdk(
             ImageSynthesis.async_call,
             model=model,
             prompt=prompt,
@@ -124,9 +144,49 @@ class DashScopeClient(BaseClient):
             check_failed_func=lambda resp: resp.is_finished and not resp.is_succeeded,
             callback=callback,
             timeout=600,
-            interval=polling_interval
+            interval=polling_interval,
+            initial_interval=2.0
         )
 
+    async def generate_images_batch(
+        self,
+        params_list: List[Union[Dict[str, Any], DashScopeImageParams]],
+        callback: Optional[Callable] = None,
+        polling_interval: int = 5,
+        **kwargs
+    ) -> List[DashScopeStatusResponse]:
+        """
+        Submits several image generation tasks concurrently and waits for all of them.
+
+        The tasks are polled together (see BaseClient.poll_tasks), so N
+        concurrent generations share one polling schedule.
+
+        Args:
+            params_list: Task parameters, one entry per image task.
+            callback: Optional async callback for status updates of any task.
+            polling_interval: Interval in seconds for status checks (default 5).
+            **kwargs: Additional arguments passed to the DashScope SDK.
+
+        Returns:
+            List[DashScopeStatusResponse]: Final status per task, in input order.
+        """
+        submitted = await asyncio.gather(
+            *(self.generate_image(params, wait=False, **kwargs) for params in params_list)
+        )
+        task_ids = [resp.task_id for resp in submitted if not resp.is_finished]
+        final = await self.poll_tasks(
+            task_ids,
+            get_status_func=self.get_task_status,
+            check_success_func=lambda resp: resp.is_succeeded,
+            check_failed_func=lambda resp: resp.is_finished and not resp.is_succeeded,
+            callback=callback,
+            timeout=600,
+            interval=polling_interval,
+            initial_interval=2.0
+        ) if task_ids else {}
+        # Failed submissions are returned as-is
+        return [final.get(resp.task_id, resp) for resp in submitted]
+
     async def edit_image(
         self, 
         params: Union[Dict[str, Any], DashScopeImageEditParams],
@@ -144,8 +204,8 @@ class DashScopeClient(BaseClient):
             DashScopeStatusResponse: Response containing generated image results.
         """
         # 1. Prepare request
-        request = DashScopeImageEditParams(**params) if isinstance(params, dict) else params
-        request_data = request.model_dump(exclude_none=True)
+        request = DashScopeImageEditParams.model_validate(params) if isinstance(params, dict) else params
+        request_data = self._dump_nonnull(request)
         
         model = request_data.pop("model")
         
@@ -154,7 +214,7 @@ class DashScopeClient(BaseClient):
         sdk_args = {**request_data, **kwargs}
         
         # 2. Synchronous Call (wrapped in thread)
-        response = await asyncio.to_thread(
+        response = await _run_sdk(
             MultiModalConversation.call,
             api_key=self.api_key,
             model=model,
@@ -174,19 +234,15 @@ class DashScopeClient(BaseClient):
             )
 
         # Extract results from choices
-        results = []
         try:
             # MultiModalConversation output structure: output.choices[0].message.content[i].image
-            choices = data.get("output", {}).get("choices", [])
-            if choices:
-                content_list = choices[0].get("message", {}).get("content", [])
-                for item in content_list:
-                    if "image" in item:
-                        results.append({"url": item["image"]})
-        except Exception as e:
-            logger.error(f"DashScope: Error parsing image edit results: {e}")
+            content_list = data["output"]["choices"][0]["message"]["content"]
+            results = [DashScopeImageItem.model_construct(url=item["image"]) for item in content_list if "image" in item]
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error(f"DashScope: Error parsing image edit results: {e!r}")
+            results = []
 
-        return DashScopeStatusResponse(
+        return DashScopeStatusResponse.model_construct(
             task_status="SUCCEEDED",
             results=results,
             usage=data.get("usage")
@@ -194,7 +250,7 @@ class DashScopeClient(BaseClient):
 
     async def get_video_task_status(self, task_id: str) -> DashScopeStatusResponse:
         """Fetch the current status of the video synthesis task"""
-        response = await asyncio.to_thread(
+        response = await _run_sdk(
             VideoSynthesis.fetch,
             task=task_id
         )
@@ -202,7 +258,7 @@ class DashScopeClient(BaseClient):
         output = data.get("output", {})
         task_status = output.get("task_status", "UNKNOWN")
         
-        return DashScopeStatusResponse(
+        return DashScopeStatusResponse.model_construct(
             task_id=task_id,
             task_status=task_status,
             video_url=output.get("video_url"),
@@ -234,8 +290,8 @@ class DashScopeClient(BaseClient):
             DashScopeStatusResponse: Final status of the task.
         """
         # 1. Prepare request
-        request = DashScopeVideoParams(**params) if isinstance(params, dict) else params
-        request_data = request.model_dump(exclude_none=True)
+        request = DashScopeVideoParams.model_validate(params) if isinstance(params, dict) else params
+        request_data = self._dump_nonnull(request)
         
         logger.info(f"DashScope: Submitting video task for {request_data.get('model')}...")
         
@@ -244,7 +300,7 @@ class DashScopeClient(BaseClient):
             sdk_args["api_key"] = self.api_key
 
         # 2. Async Submission
-        response = await asyncio.to_thread(
+        response = await _run_sdk(
             VideoSynthesis.async_call,
             **sdk_args
         )
@@ -271,7 +327,8 @@ class DashScopeClient(BaseClient):
             check_failed_func=lambda resp: resp.is_finished and not resp.is_succeeded,
             callback=callback,
             timeout=1200, # Video generation takes longer
-            interval=polling_interval
+            interval=polling_interval,
+            initial_interval=5.0 # and never finishes within the first seconds
         )
 
 def create_dashscope_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> DashScopeClient:
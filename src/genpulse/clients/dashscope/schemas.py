@@ -99,7 +99,7 @@ class DashScopeStatusResponse(BaseModel):
 
     @property
     def is_finished(self) -> bool:
-        return self.task_status in ["SUCCEEDED", "FAILED", "CANCELED"]
+        return self.task_status in {"SUCCEEDED", "FAILED", "CANCELED"}
 
     @property
     def is_succeeded(self) -> bool:
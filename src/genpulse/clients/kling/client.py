@@ -10,10 +10,35 @@ from .schemas import (
     KlingTextToVideoParams,
     KlingImageToVideoParams,
     KlingMultiImageToVideoParams,
-    KlingStatusResponse
+    KlingStatusResponse,
+    KlingTaskData,
+    KlingTaskInfo,
+    KlingVideoInfo
 )
 
 
+def _construct_status(data: Dict[str, Any]) -> KlingStatusResponse:
+    """
+    Build a poll response without validation.
+
+    Status payloads are re-read every few seconds for the whole task, so
+    they skip the validator; the submit response is still fully validated.
+    """
+    task = data.get("data")
+    if not isinstance(task, dict):
+        # Error payload without task data: let validation raise a clear error
+        return KlingStatusResponse.model_validate(data)
+    info, video = task.get("task_info"), task.get("video_info")
+    return KlingStatusResponse.model_construct(**{
+        **data,
+        "data": KlingTaskData.model_construct(**{
+            **task,
+            "task_info": KlingTaskInfo.model_construct(**info) if info else None,
+            "video_info": KlingVideoInfo.model_construct(**video) if video else None,
+        }),
+    })
+
+
 class KlingClient(BaseClient):
     """
     Kling AI Service Client
@@ -33,6 +58,10 @@ class KlingClient(BaseClient):
         if not self.ak or not self.sk:
             raise ValueError("Kling AK and SK are required for authentication.")
 
+        # Tokens are valid for 30 minutes; headers are reused until close to expiry
+        self._headers: Dict[str, str] = {}
+        self._headers_refresh_at = 0.0
+
     def _generate_token(self) -> str:
         """Dynamic JWT token generator for Kling AI API"""
         headers = {"alg": "HS256", "typ": "JWT"}
@@ -44,12 +73,15 @@ class KlingClient(BaseClient):
         return jwt.encode(payload, self.sk, headers=headers)
 
     def _get_headers(self) -> Dict[str, str]:
-        """Generate common headers with dynamic JWT for each request"""
-        token = self._generate_token()
-        return {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+        """Common headers with a dynamic JWT, re-signed 5 minutes before it expires"""
+        now = time.time()
+        if now >= self._headers_refresh_at:
+            self._headers = {
+                "Authorization": f"Bearer {self._generate_token()}",
+                "Content-Type": "application/json"
+            }
+            self._headers_refresh_at = now + 1500
+        return self._headers
 
     # --- Public Methods ---
 
@@ -57,7 +89,7 @@ class KlingClient(BaseClient):
         """Query task status and result"""
         logger.info(f"Kling: Querying task {task_id}")
         data = await self._request("GET", f"/v1/videos/text2video/{task_id}")
-        return KlingStatusResponse(**data)
+        return _construct_status(data)
 
     async def text_to_video(
         self, 
@@ -165,13 +197,14 @@ class KlingClient(BaseClient):
         **kwargs
     ) -> KlingStatusResponse:
         """Shared logic for task submission and optional polling"""
-        request = params_model(**params) if isinstance(params, dict) else params
-        request_data = request.model_dump(exclude_none=True)
+        request = params_model.model_validate(params) if isinstance(params, dict) else params
+        # Serialize straight to JSON bytes in pydantic-core, without a dict round trip
+        body = request.model_dump_json(exclude_none=True).encode()
         
         logger.info(f"Kling: Submitting task to {endpoint}")
         
-        data = await self._request("POST", endpoint, json=request_data, **kwargs)
-        init_resp = KlingStatusResponse(**data)
+        raw = await self._request_raw("POST", endpoint, content=body, **kwargs)
+        init_resp = KlingStatusResponse.model_validate_json(raw)
         
         if init_resp.code != 0:
             raise Exception(f"Kling API Error ({init_resp.code}): {init_resp.message}")
@@ -188,7 +221,8 @@ class KlingClient(BaseClient):
             check_failed_func=lambda resp: resp.is_finished and not resp.is_succeeded,
             callback=callback,
             timeout=2400,
-            interval=polling_interval
+            interval=polling_interval,
+            initial_interval=3.0
         )
 
 def create_kling_client(ak: Optional[str] = None, sk: Optional[str] = None, base_url: Optional[str] = None) -> KlingClient:
@@ -102,7 +102,7 @@ class KlingStatusResponse(BaseModel):
 
     @property
     def is_finished(self) -> bool:
-        return self.data.task_status in ["succeed", "failed"]
+        return self.data.task_status in {"succeed", "failed"}
 
     @property
     def is_succeeded(self) -> bool:
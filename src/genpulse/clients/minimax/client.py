@@ -88,13 +88,13 @@ class MinimaxClient(BaseClient):
         Returns:
             MinimaxTaskStatusResponse: Final status of the task.
         """
-        request = MinimaxVideoParams(**params) if isinstance(params, dict) else params
+        request = MinimaxVideoParams.model_validate(params) if isinstance(params, dict) else params
         request.callback_url = request.callback_url or self.callback_url
-        request_data = request.model_dump(exclude_none=True)
+        body = request.model_dump_json(exclude_none=True).encode()
         
         logger.info(f"Minimax: Submitting video generation task (Model: {request.model})")
         
-        data = await self._request("POST", "/v1/video_generation", json=request_data, **kwargs)
+        data = await self._request("POST", "/v1/video_generation", content=body, **kwargs)
         init_resp = MinimaxVideoResponse(**data)
         
         if init_resp.base_resp.status_code != 0:
@@ -138,12 +138,12 @@ class MinimaxClient(BaseClient):
         Returns:
             MinimaxImageResponse: Response containing generated image URLs.
         """
-        request = MinimaxImageParams(**params) if isinstance(params, dict) else params
-        request_data = request.model_dump(exclude_none=True)
+        request = MinimaxImageParams.model_validate(params) if isinstance(params, dict) else params
+        body = request.model_dump_json(exclude_none=True).encode()
         
         logger.info(f"Minimax: Submitting image generation task (Model: {request.model})")
         
-        data = await self._request("POST", "/v1/image_generation", json=request_data, **kwargs)
+        data = await self._request("POST", "/v1/image_generation", content=body, **kwargs)
         resp = MinimaxImageResponse(**data)
         
         if not resp.is_succeeded:
@@ -192,12 +192,12 @@ class MinimaxClient(BaseClient):
         Returns:
             MinimaxSpeechStatusResponse: Final status of the task involving audio download URL.
         """
-        request = MinimaxSpeechParams(**params) if isinstance(params, dict) else params
-        request_data = request.model_dump(exclude_none=True)
+        request = MinimaxSpeechParams.model_validate(params) if isinstance(params, dict) else params
+        body = request.model_dump_json(exclude_none=True).encode()
         
         logger.info(f"Minimax: Submitting speech generation task (Model: {request.model})")
         
-        data = await self._request("POST", "/v1/t2a_async_v2", json=request_data, **kwargs)
+        data = await self._request("POST", "/v1/t2a_async_v2", content=body, **kwargs)
         init_resp = MinimaxSpeechResponse(**data)
         
         if init_resp.base_resp.status_code != 0:
@@ -59,7 +59,7 @@ class MinimaxTaskStatusResponse(BaseModel):
 
     @property
     def is_finished(self) -> bool:
-        return self.status in ["Success", "Fail"]
+        return self.status in {"Success", "Fail"}
 
     @property
     def is_succeeded(self) -> bool:
@@ -195,7 +195,7 @@ class MinimaxSpeechStatusResponse(BaseModel):
     @property
     def is_finished(self) -> bool:
         s = self.status.lower()
-        return s in ["success", "failed", "expired"]
+        return s in {"success", "failed", "expired"}
 
     @property
     def is_succeeded(self) -> bool:
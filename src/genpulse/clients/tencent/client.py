@@ -1,8 +1,9 @@
 import asyncio
 from loguru import logger
 import os
-import json
+import orjson
 from typing import Optional, Dict, Any, Union, Callable
+from pydantic import BaseModel
 from tencentcloud.common import credential
 from tencentcloud.common.profile.client_profile import ClientProfile
 from tencentcloud.common.profile.http_profile import HttpProfile
@@ -56,6 +57,13 @@ class TencentVodClient(BaseClient):
         
         self.client = vod_client.VodClient(cred, self.region, client_profile)
 
+    def _request_json(self, request: BaseModel, extra: Dict[str, Any]) -> str:
+        """SDK request JSON for the params plus any extra kwargs (which win)."""
+        if not extra:
+            # Common case: serialize in one pass in pydantic-core
+            return request.model_dump_json(exclude_none=True)
+        return orjson.dumps({**self._dump_nonnull(request), **extra}).decode()
+
     async def get_task_status(self, task_id: str, sub_app_id: Optional[int] = None) -> TencentTaskDetailResponse:
         """
         Unified status check for any VOD task using DescribeTaskDetail.
@@ -67,7 +75,7 @@ class TencentVodClient(BaseClient):
         req.SubAppId = sub_app_id or self.sub_app_id
         
         resp = await asyncio.to_thread(self.client.DescribeTaskDetail, req)
-        data = json.loads(resp.to_json_string())
+        data = orjson.loads(resp.to_json_string())
         return TencentTaskDetailResponse(**data)
 
     async def generate_video(
@@ -91,19 +99,15 @@ class TencentVodClient(BaseClient):
         Returns:
             TencentTaskDetailResponse: Final status and details of the task.
         """
-        request = TencentVideoParams(**params) if isinstance(params, dict) else params
+        request = TencentVideoParams.model_validate(params) if isinstance(params, dict) else params
         request.SubAppId = request.SubAppId or self.sub_app_id
         
-        request_data = request.model_dump(exclude_none=True)
-        # Merge additional kwargs into request_data
-        request_data.update(kwargs)
-
         logger.info(f"Tencent: Creating AIGC video task (Model: {request.ModelName})")
         req = models.CreateAigcVideoTaskRequest()
-        req.from_json_string(json.dumps(request_data))
+        req.from_json_string(self._request_json(request, kwargs))
         
         resp = await asyncio.to_thread(self.client.CreateAigcVideoTask, req)
-        data = json.loads(resp.to_json_string())
+        data = orjson.loads(resp.to_json_string())
         init_resp = TencentTaskResponse(**data)
         task_id = init_resp.TaskId
         logger.info(f"Tencent: Task created. ID: {task_id}; Data: {data}")
@@ -151,19 +155,15 @@ class TencentVodClient(BaseClient):
         Returns:
             TencentTaskDetailResponse: Final status and details of the task.
         """
-        request = TencentImageParams(**params) if isinstance(params, dict) else params
+        request = TencentImageParams.model_validate(params) if isinstance(params, dict) else params
         request.SubAppId = request.SubAppId or self.sub_app_id
         
-        request_data = request.model_dump(exclude_none=True)
-        # Merge additional kwargs into request_data
-        request_data.update(kwargs)
-
         logger.info(f"Tencent: Creating AIGC image task (Model: {request.ModelName})")
         req = models.CreateAigcImageTaskRequest()
-        req.from_json_string(json.dumps(request_data))
+        req.from_json_string(self._request_json(request, kwargs))
         
         resp = await asyncio.to_thread(self.client.CreateAigcImageTask, req)
-        data = json.loads(resp.to_json_string())
+        data = orjson.loads(resp.to_json_string())
         init_resp = TencentTaskResponse(**data)
         task_id = init_resp.TaskId
         logger.info(f"Tencent: Task created. ID: {task_id}; Data: {data}")
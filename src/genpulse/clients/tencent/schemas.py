@@ -159,7 +159,7 @@ class TencentTaskDetailResponse(BaseModel):
     @property
     def is_finished(self) -> bool:
         """Determines if the task has reached a terminal state (Success or Error)"""
-        return self.Status in ["FINISH", "ABORTED"]
+        return self.Status in {"FINISH", "ABORTED"}
 
     @property
     def is_succeeded(self) -> bool:
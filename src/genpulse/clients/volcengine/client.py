@@ -44,7 +44,7 @@ class VolcEngineClient(BaseClient):
         Returns:
             ArkResponse: Synchronous response containing generated images.
         """
-        request = VolcImageParams(**params) if isinstance(params, dict) else params
+        request = VolcImageParams.model_validate(params) if isinstance(params, dict) else params
         request_data = request.model_dump(exclude_none=True, mode="json")
         
         logger.info(f"Volcengine: Sending image generation request: {request_data}")
@@ -90,7 +90,7 @@ class VolcEngineClient(BaseClient):
             VolcVideoStatusResponse: Final status of the task.
         """
         # 1. Create the task
-        request = VolcVideoParams(**params) if isinstance(params, dict) else params
+        request = VolcVideoParams.model_validate(params) if isinstance(params, dict) else params
         request_data = request.model_dump(exclude_none=True, mode="json")
         
         logger.info(f"Volcengine: Creating video generation task: {request_data}")
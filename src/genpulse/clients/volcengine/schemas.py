@@ -116,5 +116,5 @@ class VolcVideoStatusResponse(BaseModel):
     # Validation helpers
     @property
     def is_finished(self) -> bool:
-        return self.status in ["succeeded", "failed", "cancelled", "expired"]
+        return self.status in {"succeeded", "failed", "cancelled", "expired"}
 
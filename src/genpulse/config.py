@@ -38,15 +38,35 @@ def is_dev():
 ENV = get_env()
 DATABASE_URL = settings.DATABASE_URL
 REDIS_URL = settings.REDIS.URL
+REDIS_MAX_CONNECTIONS = settings.REDIS.get("MAX_CONNECTIONS", 64)
+REDIS_STREAM_MAX_CONNECTIONS = settings.REDIS.get("STREAM_MAX_CONNECTIONS", 8)
+REDIS_HEALTH_CHECK_INTERVAL = settings.REDIS.get("HEALTH_CHECK_INTERVAL", 30)
+
+# Database Pool Settings
+DB_POOL_SIZE = settings.DATABASE.get("POOL_SIZE", 20)
+DB_MAX_OVERFLOW = settings.DATABASE.get("MAX_OVERFLOW", 40)
+DB_POOL_RECYCLE = settings.DATABASE.get("POOL_RECYCLE", 1800)
+DB_ECHO = settings.DATABASE.get("ECHO", False)
 
 # MQ Settings
 MQ_TYPE = settings.MQ.get("TYPE", "celery")
 
 CELERY_BROKER_URL = settings.MQ.get("CELERY_BROKER_URL", settings.REDIS.URL)
 CELERY_RESULT_BACKEND = settings.MQ.get("CELERY_RESULT_BACKEND", settings.REDIS.URL)
+# Messages reserved per worker process per broker fetch (1 = fair dispatch for long tasks)
+CELERY_PREFETCH_MULTIPLIER = settings.MQ.get("PREFETCH_MULTIPLIER", 1)
+# Seconds an idle worker blocks in BRPOP before re-polling the broker
+CELERY_BRPOP_TIMEOUT = settings.MQ.get("BRPOP_TIMEOUT", 5)
+# Worker child processes (None = Celery default, one per CPU)
+CELERY_WORKER_CONCURRENCY = settings.MQ.get("WORKER_CONCURRENCY")
+# Base task queue; non-normal priorities are sharded into "<base>.<priority>"
+CELERY_TASK_QUEUE = settings.MQ.get("TASK_QUEUE", "genpulse_tasks")
+TASK_PRIORITIES = ("high", "normal", "low")
 
 # Rate Limits
-RATE_LIMITS = settings.get("ratelimits", {"default": 10.0})
+# Resolved once into a plain dict; looked up on every task
+RATE_LIMITS = {str(k).lower(): float(v) for k, v in settings.get("ratelimits", {"default": 10.0}).items()}
+DEFAULT_RATE_LIMIT = RATE_LIMITS.get("default", 10.0)
 
 STORAGE_TYPE = settings.STORAGE.TYPE
 STORAGE_LOCAL_PATH = settings.STORAGE.LOCAL_PATH
@@ -60,6 +80,8 @@ S3_BUCKET_NAME = settings.STORAGE.get("S3_BUCKET_NAME", "genpulse")
 S3_REGION_NAME = settings.STORAGE.get("S3_REGION_NAME", "us-east-1")
 
 COMFY_URL = settings.PROVIDERS.get("COMFY_URL", "http://127.0.0.1:8188")
+# Upper bound on waiting for a queued ComfyUI prompt to finish (seconds)
+COMFY_WAIT_TIMEOUT = settings.PROVIDERS.get("COMFY_WAIT_TIMEOUT", 1800)
 DEFAULT_IMAGE_PROVIDER = settings.PROVIDERS.DEFAULT_IMAGE_PROVIDER
 DEFAULT_VIDEO_PROVIDER = settings.PROVIDERS.DEFAULT_VIDEO_PROVIDER
 
@@ -67,3 +89,6 @@ DEFAULT_VIDEO_PROVIDER = settings.PROVIDERS.DEFAULT_VIDEO_PROVIDER
 REDIS_PREFIX = f"{ENV}:"
 TASK_QUEUE_NAME = f"{REDIS_PREFIX}tasks"
 TASK_STATUS_PREFIX = f"{REDIS_PREFIX}task_status:"
+TASK_EVENTS_STREAM = f"{REDIS_PREFIX}task_events"
+TASK_OUTBOX_KEY = f"{REDIS_PREFIX}tasks:outbox"
+TASK_EVENTS_MAXLEN = 100_000
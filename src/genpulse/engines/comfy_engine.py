@@ -1,16 +1,34 @@
-import io
 import uuid
+import httpx
 from typing import Dict, Any
 from loguru import logger
 from genpulse.engines.base import BaseEngine
-from genpulse.clients.comfyui.client import ComfyClient
-from genpulse.infra.storage import get_storage
+from genpulse.clients.comfyui.client import ComfyClient, make_http_pool
+from genpulse.infra.storage import get_storage, upload_many
 from genpulse.handlers.registry import registry
 from genpulse.types import TaskContext
 from genpulse import config
 
 @registry.register("comfyui")
 class ComfyEngine(BaseEngine):
+    # Keep-alive connection pools are reused per server address. Clients are not:
+    # ComfyUI keeps one websocket per client_id, so every task gets its own.
+    _pools: Dict[str, httpx.AsyncClient] = {}
+
+    @classmethod
+    def _get_client(cls, base_url: str) -> ComfyClient:
+        pool = cls._pools.get(base_url)
+        if pool is None or pool.is_closed:
+            pool = cls._pools[base_url] = make_http_pool()
+        return ComfyClient(base_url=base_url, http=pool)
+
+    @classmethod
+    async def close_pools(cls):
+        """Close the shared connection pools (worker shutdown)."""
+        pools, cls._pools = list(cls._pools.values()), {}
+        for pool in pools:
+            await pool.aclose()
+
     def validate_params(self, params: Dict[str, Any]) -> bool:
         if "workflow" not in params:
             logger.error("Missing 'workflow' in params")
@@ -23,7 +41,7 @@ class ComfyEngine(BaseEngine):
         # Allow override from params, but default to config
         base_url = params.get("server_address", config.COMFY_URL)
         
-        client = ComfyClient(base_url=base_url)
+        client = self._get_client(base_url)
         storage = get_storage()
         
         try:
@@ -34,17 +52,15 @@ class ComfyEngine(BaseEngine):
             
             # 2. Wait for completion
             await context.update_status("processing", progress=30, result={"info": "Waiting for generation"})
-            images = await client.wait_for_completion(prompt_id)
+            images = await client.wait_for_completion(prompt_id, timeout=config.COMFY_WAIT_TIMEOUT)
             
             # 3. Handle results
             await context.update_status("processing", progress=80, result={"info": "Uploading results"})
-            urls = []
-            for i, img_bytes in enumerate(images):
-                # Generate a unique path for the result
-                # Format: {task_id}/out_{index}_{uuid}.png
-                file_path = f"{task['task_id']}/out_{i}_{uuid.uuid4().hex[:8]}.png"
-                url = await storage.upload(file_path, io.BytesIO(img_bytes), content_type="image/png")
-                urls.append(url)
+            # Format: {task_id}/out_{index}_{uuid}.png
+            urls = await upload_many(storage, (
+                (f"{task['task_id']}/out_{i}_{uuid.uuid4().hex[:8]}.png", img_bytes, "image/png")
+                for i, img_bytes in enumerate(images)
+            ))
             
             return {
                 "comfy_prompt_id": prompt_id,
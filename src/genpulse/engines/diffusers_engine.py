@@ -1,15 +1,126 @@
 import io
 import uuid
 import asyncio
-from typing import Dict, Any, Optional
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 from loguru import logger
 from genpulse.engines.base import BaseEngine
 from genpulse.infra.storage import get_storage
 from genpulse.handlers.registry import registry
 from genpulse.types import TaskContext, EngineError
+from genpulse.utils.progress import ProgressReporter
 
-# Global cache for pipelines to avoid repeated loading
-_PIPELINE_CACHE: Dict[str, Any] = {}
+# Global cache for pipelines to avoid repeated loading (and re-compiling),
+# keyed by (model_id, precision, device)
+_PIPELINE_CACHE: Dict[Tuple[str, str, str], Any] = {}
+
+# precision -> (torch dtype, torchao weight-only quantizer or None)
+PRECISIONS = {
+    "fp32": ("float32", None),
+    "fp16": ("float16", None),
+    "bf16": ("bfloat16", None),
+    "int8": ("float16", "int8_weight_only"),
+    "fp8": ("bfloat16", "float8_weight_only"),
+}
+
+# One worker thread per device: GPU work for a device is serialized on a single
+# thread instead of racing for the CUDA context from the default pool
+_DEVICE_EXECUTORS: Dict[str, ThreadPoolExecutor] = {}
+
+def _device_executor(device: str) -> ThreadPoolExecutor:
+    executor = _DEVICE_EXECUTORS.get(device)
+    if executor is None:
+        executor = _DEVICE_EXECUTORS[device] = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"diff-{device.replace(':', '')}"
+        )
+    return executor
+
+async def _run_on_device(device: str, func, *args):
+    """Run blocking model work on the device's dedicated thread."""
+    return await asyncio.get_running_loop().run_in_executor(_device_executor(device), func, *args)
+
+# params["format"] -> (PIL format, content type, encoder options)
+IMAGE_FORMATS = {
+    # Low zlib level: level 6 costs several times the CPU for a few % smaller files
+    "png": ("PNG", "image/png", {"compress_level": 1}),
+    "webp": ("WEBP", "image/webp", {"quality": 95, "method": 4}),
+}
+
+def _encode_image(img, fmt: str) -> io.BytesIO:
+    """Encode a PIL image into an in-memory buffer ready for upload."""
+    pil_format, _, options = IMAGE_FORMATS[fmt]
+    buf = io.BytesIO()
+    img.save(buf, format=pil_format, **options)
+    buf.seek(0)
+    return buf
+
+# Optional pipeline call arguments passed through from task params
+PIPELINE_ARGS = ("negative_prompt", "width", "height", "guidance_scale", "num_images_per_prompt", "seed")
+
+def _default_device() -> str:
+    import torch
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+def _default_precision(device: str) -> str:
+    """
+    Pick the fastest precision the device supports: fp8 on Hopper+, int8 on
+    Ampere. The quantized modes need torchao; without it Ampere+ runs bf16.
+    """
+    if not device.startswith("cuda"):
+        return "fp32"
+    import torch
+    major, _ = torch.cuda.get_device_capability(device)
+    if major >= 8 and importlib.util.find_spec("torchao") is None:
+        return "bf16"
+    if major >= 9:
+        return "fp8"
+    if major >= 8:
+        return "int8"
+    return "fp16"
+
+def _load_pipeline(model_id: str, precision: str, device: str):
+    """Load a pipeline with fused SDPA attention and a quantized, compiled UNet."""
+    import torch
+    from diffusers import DiffusionPipeline
+    from diffusers.models.attention_processor import AttnProcessor2_0
+
+    dtype, quantizer = PRECISIONS[precision]
+    pipe = DiffusionPipeline.from_pretrained(model_id, torch_dtype=getattr(torch, dtype))
+    pipe.to(device)
+    unet = getattr(pipe, "unet", None)
+    if unet is not None:
+        # PyTorch 2 scaled-dot-product attention instead of attention slicing
+        unet.set_attn_processor(AttnProcessor2_0())
+        if quantizer:
+            from torchao import quantization
+            quantization.quantize_(unet, getattr(quantization, quantizer)())
+        if device.startswith("cuda"):
+            pipe.unet = torch.compile(unet, mode="reduce-overhead", fullgraph=False)
+    return pipe
+
+def _cached_pipeline(model_id: str, precision: str, device: str):
+    """
+    Cache lookup and load, run on the device thread. Concurrent first requests
+    queue up there, so each pipeline is loaded once rather than once per caller.
+    """
+    key = (model_id, precision, device)
+    pipe = _PIPELINE_CACHE.get(key)
+    if pipe is None:
+        pipe = _PIPELINE_CACHE[key] = _load_pipeline(model_id, precision, device)
+    return pipe
+
+def _generate(pipe, prompt: str, params: Dict[str, Any], steps: int, device: str, callback) -> list:
+    """Run the pipeline (blocking) and return PIL images."""
+    kwargs = {"prompt": prompt, "num_inference_steps": steps, "callback_on_step_end": callback}
+    for key in PIPELINE_ARGS:
+        if params.get(key) is not None:
+            kwargs[key] = params[key]
+    seed = kwargs.pop("seed", None)
+    if seed is not None:
+        import torch
+        kwargs["generator"] = torch.Generator(device=device).manual_seed(int(seed))
+    return pipe(**kwargs).images
 
 @registry.register("diffusers")
 class DiffusersEngine(BaseEngine):
@@ -22,21 +133,24 @@ class DiffusersEngine(BaseEngine):
         if "prompt" not in params:
             logger.warning("Diffusers: Missing 'prompt' in parameters")
             return False
+        if params.get("format", "png") not in IMAGE_FORMATS:
+            logger.warning(f"Diffusers: Unsupported image format '{params['format']}'")
+            return False
         return True
 
     async def execute(self, task: Dict[str, Any], context: TaskContext) -> Dict[str, Any]:
         params = task.get("params", {})
-        model_id = params.get("model_id", "mock").lower()
+        # Hub model ids are case-sensitive; only the mock switch is not
+        model_id = params.get("model_id", "mock")
         prompt = params["prompt"]
         
         logger.info(f"Diffusers execution started Task={context.task_id} Model={model_id}")
         await context.set_processing(progress=10, info="Initializing engine")
 
         try:
-            if model_id == "mock":
+            if model_id.lower() == "mock":
                 return await self._execute_mock(task, context)
             
-            # Placeholder for real inference
             return await self._execute_real(task, context, model_id, prompt, params)
 
         except Exception as e:
@@ -47,20 +161,17 @@ class DiffusersEngine(BaseEngine):
         """Fast mock execution path for development"""
         logger.debug("Running in MOCK mode")
         await context.set_processing(progress=50, info="Generating (mock)")
-        
-        # Simulate some async work
-        await asyncio.sleep(0.5)
 
         from PIL import Image
         img = Image.new('RGB', (512, 512), color=(73, 109, 137))
         
         storage = get_storage()
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format='PNG')
-        img_byte_arr.seek(0)
+        fmt = task.get("params", {}).get("format", "png")
+        # Encoding is CPU-bound; keep it off the event loop
+        img_byte_arr = await asyncio.to_thread(_encode_image, img, fmt)
         
-        file_path = f"{context.task_id}/diff_mock_{uuid.uuid4().hex[:8]}.png"
-        url = await storage.upload(file_path, img_byte_arr, content_type="image/png")
+        file_path = f"{context.task_id}/diff_mock_{uuid.uuid4().hex[:8]}.{fmt}"
+        url = await storage.upload(file_path, img_byte_arr, content_type=IMAGE_FORMATS[fmt][1])
         
         await context.set_processing(progress=90, info="Finalizing")
         return {
@@ -70,18 +181,48 @@ class DiffusersEngine(BaseEngine):
         }
 
     async def _execute_real(self, task: Dict[str, Any], context: TaskContext, model_id: str, prompt: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Real inference path (currently blocked to avoid downloads)"""
-        # In the future, this will import diffusers and run stable diffusion
-        msg = f"Model ID '{model_id}' requires download. Run with model_id='mock' for local testing."
-        raise EngineError(msg, provider="diffusers")
-
-    async def _get_pipeline(self, model_id: str):
-        """Helper to load and cache pipelines"""
-        if model_id in _PIPELINE_CACHE:
-            return _PIPELINE_CACHE[model_id]
-        
-        # import diffusers ...
-        # pipe = StableDiffusionPipeline.from_pretrained(model_id)
-        # _PIPELINE_CACHE[model_id] = pipe
-        # return pipe
-        raise NotImplementedError("Real pipeline loading not enabled yet")
+        """Real inference path: cached pipeline, step progress, concurrent uploads."""
+        device = params.get("device") or _default_device()
+        pipe = await self._get_pipeline(model_id, params.get("precision"), device)
+
+        steps = int(params.get("steps", 30))
+        async with ProgressReporter(context) as progress:
+            # Same thread that loaded the pipeline, so jobs on one device queue up
+            images = await _run_on_device(
+                device, _generate, pipe, prompt, params, steps, device, progress.step_callback(steps)
+            )
+
+        storage = get_storage()
+        fmt = params.get("format", "png")
+        content_type = IMAGE_FORMATS[fmt][1]
+        bufs = await asyncio.gather(*(asyncio.to_thread(_encode_image, img, fmt) for img in images))
+        urls = await asyncio.gather(*(
+            storage.upload(f"{context.task_id}/diff_{uuid.uuid4().hex[:8]}.{fmt}", buf, content_type=content_type)
+            for buf in bufs
+        ))
+
+        await context.set_processing(progress=90, info="Finalizing")
+        return {
+            "images": list(urls),
+            "model": model_id,
+            "provider": "diffusers"
+        }
+
+    async def _get_pipeline(self, model_id: str, precision: Optional[str] = None, device: str = "cuda"):
+        """
+        Helper to load and cache pipelines; the compile cost is paid once per key.
+
+        Args:
+            precision: One of PRECISIONS (e.g. params["precision"]); defaults to
+                the best fit for the device.
+        """
+        if precision is None:
+            precision = _default_precision(device)
+        elif precision not in PRECISIONS:
+            raise EngineError(f"Unsupported precision '{precision}'", provider="diffusers")
+        elif PRECISIONS[precision][1] and importlib.util.find_spec("torchao") is None:
+            raise EngineError(f"Precision '{precision}' requires the torchao package", provider="diffusers")
+        pipe = _PIPELINE_CACHE.get((model_id, precision, device))
+        if pipe is None:
+            pipe = await _run_on_device(device, _cached_pipeline, model_id, precision, device)
+        return pipe
@@ -1,17 +1,16 @@
 import asyncio
-import json
+import orjson
 import uuid
 import aiohttp
 from typing import Any, Dict, List, Optional
-import httpx
 from genpulse.handlers.base import BaseHandler
 from genpulse.handlers.registry import registry
 from genpulse.types import TaskContext, EngineError
 from genpulse.utils.comfy import parse_workflow_template, apply_params
+from genpulse.utils.progress import ProgressReporter
 from genpulse import config
-from genpulse.infra.storage import get_storage
+from genpulse.infra.storage import get_storage, upload_many
 from loguru import logger
-import io
 
 @registry.register("comfy-workflow")
 class ComfyUIHandler(BaseHandler):
@@ -19,6 +18,27 @@ class ComfyUIHandler(BaseHandler):
     Handler for executing ComfyUI workflows using WebSocket for real-time progress 
     and binary image retrieval.
     """
+    # Shared across tasks so HTTP and WS connects reuse pooled keep-alive connections.
+    # aiohttp sessions are bound to the loop they were created on.
+    _session: Optional[aiohttp.ClientSession] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._session_loop is not loop:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75)
+            )
+            cls._session_loop = loop
+        return cls._session
+
+    @classmethod
+    async def close_session(cls):
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+        cls._session_loop = None
     
     def validate_params(self, params: Dict[str, Any]) -> bool:
         if "workflow" not in params:
@@ -32,6 +52,12 @@ class ComfyUIHandler(BaseHandler):
             
         return True
 
+    @staticmethod
+    async def _fetch(session: aiohttp.ClientSession, url: str):
+        """GET url; returns (status, body, content type)."""
+        async with session.get(url) as resp:
+            return resp.status, await resp.read(), resp.headers.get("content-type")
+
     async def execute(self, task_data: Dict[str, Any], context: TaskContext) -> Dict[str, Any]:
         params = task_data.get("params", {})
         workflow = params.get("workflow")
@@ -61,105 +87,112 @@ class ComfyUIHandler(BaseHandler):
         storage = get_storage()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                ws_url = f"{ws_address}/ws?clientId={client_id}"
-                logger.info(f"Connecting to WS: {ws_url}")
-                
-                async with session.ws_connect(ws_url) as ws:
-                    # Submit Prompt
-                    payload = {"prompt": final_workflow, "client_id": client_id}
-                    async with session.post(f"{server_address}/prompt", json=payload) as resp:
-                        if resp.status != 200:
-                            err_text = await resp.text()
-                            raise EngineError(f"ComfyUI Submit Failed: {err_text}", provider="comfyui")
-                        prompt_res = await resp.json()
-                        prompt_id = prompt_res.get("prompt_id")
-                        logger.info(f"ComfyUI Queued: {prompt_id}")
-                        await context.set_processing(5, info="Queued")
+            session = self._get_session()
+            ws_url = f"{ws_address}/ws?clientId={client_id}"
+            logger.info(f"Connecting to WS: {ws_url}")
+            
+            # Progress ticks are handed off latest-value-wins so status writes never stall WS reads
+            async with session.ws_connect(ws_url) as ws, ProgressReporter(context) as progress:
+                # Submit Prompt
+                # Workflows can be large; serialize once with orjson instead of aiohttp's stdlib json
+                payload = orjson.dumps({"prompt": final_workflow, "client_id": client_id})
+                async with session.post(
+                    f"{server_address}/prompt",
+                    data=payload,
+                    headers={"Content-Type": "application/json"}
+                ) as resp:
+                    if resp.status != 200:
+                        err_text = await resp.text()
+                        raise EngineError(f"ComfyUI Submit Failed: {err_text}", provider="comfyui")
+                    prompt_res = await resp.json(loads=orjson.loads)
+                    prompt_id = prompt_res.get("prompt_id")
+                    logger.info(f"ComfyUI Queued: {prompt_id}")
+                    await context.set_processing(5, info="Queued")
 
-                    # Listen to WebSocket
-                    current_node = ""
-                    # We loop until execution_success or disconnected
-                    async for msg in ws:
-                        if msg.type == aiohttp.WSMsgType.TEXT:
-                            message = json.loads(msg.data)
-                            msg_type = message.get("type")
-                            data = message.get("data", {})
-                            
-                            # Filter messages only for our prompt if possible?
-                            # ComfyUI sends broadcast messages, but usually filtered by client_id if connected?
-                            # Actually /ws?clientId=... means we only get messages for OUR client_id usually?
-                            # Wait, 'executing' gives 'node' and 'prompt_id'.
-                            
-                            if msg_type == "executing":
-                                if data.get("node") is None and data.get("prompt_id") == prompt_id:
-                                    # Execution finished for this prompt
-                                    logger.info("ComfyUI Execution Finished (WS Signal)")
-                                    break
-                                elif data.get("prompt_id") == prompt_id:
-                                    # Node started
-                                    current_node = data.get("node")
-                                    # Calculate vague progress... simple increment?
-                                    await context.set_processing(None, info=f"Running Node {current_node}")
+                # Listen to WebSocket
+                current_node = ""
+                # We loop until execution_success or disconnected
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        message = orjson.loads(msg.data)
+                        msg_type = message.get("type")
+                        data = message.get("data", {})
+                        
+                        # Filter messages only for our prompt if possible?
+                        # ComfyUI sends broadcast messages, but usually filtered by client_id if connected?
+                        # Actually /ws?clientId=... means we only get messages for OUR client_id usually?
+                        # Wait, 'executing' gives 'node' and 'prompt_id'.
+                        
+                        if msg_type == "executing":
+                            if data.get("node") is None and data.get("prompt_id") == prompt_id:
+                                # Execution finished for this prompt
+                                logger.info("ComfyUI Execution Finished (WS Signal)")
+                                break
+                            elif data.get("prompt_id") == prompt_id:
+                                # Node started
+                                current_node = data.get("node")
+                                # Calculate vague progress... simple increment?
+                                progress.report(None, info=f"Running Node {current_node}")
 
-                            elif msg_type == "progress":
-                                if data.get("prompt_id") == prompt_id:
-                                    val = data.get("value")
-                                    max_val = data.get("max")
-                                    if max_val:
-                                        p = int((val / max_val) * 100)
-                                        await context.set_processing(p, info=f"Node {current_node} {p}%")
-                                        
-                            elif msg_type == "execution_cached":
-                                if data.get("prompt_id") == prompt_id:
-                                    logger.info("ComfyUI used cached result")
-                                    break
+                        elif msg_type == "progress":
+                            if data.get("prompt_id") == prompt_id:
+                                val = data.get("value")
+                                max_val = data.get("max")
+                                if max_val:
+                                    p = int((val / max_val) * 100)
+                                    progress.report(p, info=f"Node {current_node} {p}%")
+                                    
+                        elif msg_type == "execution_cached":
+                            if data.get("prompt_id") == prompt_id:
+                                logger.info("ComfyUI used cached result")
+                                break
 
-                        elif msg.type == aiohttp.WSMsgType.BINARY:
-                            # This is a Preview/SaveWebsocket image!
-                            # First 8 bytes are type/event info usually?
-                            # ComfyUI protocol:
-                            # The binary message starts with a 4-byte integer (big-endian) specifying the event type?
-                            # Standard PreviewImage: Just raw bytes? 
-                            # Actually, standard logic is: Prepend text header?
-                            # Let's assume standard PreviewImage behavior:
-                            # It comes as binary with first 4 bytes as Type (1=JPEG, 2=PNG) then data.
-                            # We can just check header or assume image.
-                            
-                            image_data = msg.data[8:] # Skip offset (8 bytes usually: 4 type, 4 params?)
-                            # Actually, for simplicity we treat it as blob.
-                            
-                            # Upload to Unified Storage
-                            fname = f"comfy/{task_data['task_id']}/{uuid.uuid4()}.png"
-                            url = await storage.upload(fname, io.BytesIO(image_data), content_type="image/png")
-                            images_result.append(url)
-                            logger.info(f"Captured binary image via WS: {url}")
+                    elif msg.type == aiohttp.WSMsgType.BINARY:
+                        # This is a Preview/SaveWebsocket image!
+                        # First 8 bytes are type/event info usually?
+                        # ComfyUI protocol:
+                        # The binary message starts with a 4-byte integer (big-endian) specifying the event type?
+                        # Standard PreviewImage: Just raw bytes? 
+                        # Actually, standard logic is: Prepend text header?
+                        # Let's assume standard PreviewImage behavior:
+                        # It comes as binary with first 4 bytes as Type (1=JPEG, 2=PNG) then data.
+                        # We can just check header or assume image.
+                        
+                        image_data = msg.data[8:] # Skip offset (8 bytes usually: 4 type, 4 params?)
+                        # Actually, for simplicity we treat it as blob.
+                        
+                        # Upload to Unified Storage
+                        fname = f"comfy/{task_data['task_id']}/{uuid.uuid4()}.png"
+                        url = await storage.upload(fname, image_data, content_type="image/png")
+                        images_result.append(url)
+                        logger.info(f"Captured binary image via WS: {url}")
 
             # 3. Post-Processing: Explicit History Check (Fallback)
             # If we didn't get any binary images (maybe standard SaveImage node used), check history.
             if not images_result:
-                async with httpx.AsyncClient() as client:
-                    hist_resp = await client.get(f"{server_address}/history/{prompt_id}")
-                    if hist_resp.status_code == 200:
-                        history_data = hist_resp.json()
-                        if prompt_id in history_data:
-                            outputs = history_data[prompt_id].get("outputs", {})
-                            for _, output_val in outputs.items():
-                                if "images" in output_val:
-                                    for img in output_val["images"]:
-                                        # Download from ComfyUI View API and Upload to S3
-                                        fname = img.get("filename")
-                                        subfolder = img.get("subfolder", "")
-                                        img_type = img.get("type", "output")
-                                        
-                                        view_url = f"{server_address}/view?filename={fname}&subfolder={subfolder}&type={img_type}"
-                                        logger.info(f"Downloading from ComfyUI: {view_url}")
-                                        
-                                        img_resp = await client.get(view_url)
-                                        if img_resp.status_code == 200:
-                                            s3_key = f"comfy/{task_data['task_id']}/{fname}"
-                                            s3_url = await storage.upload(s3_key, io.BytesIO(img_resp.content), content_type=img_resp.headers.get("content-type"))
-                                            images_result.append(s3_url)
+                status, body, _ = await self._fetch(session, f"{server_address}/history/{prompt_id}")
+                if status == 200:
+                    history_data = orjson.loads(body)
+                    if prompt_id in history_data:
+                        outputs = history_data[prompt_id].get("outputs", {})
+                        images = [
+                            img
+                            for output_val in outputs.values()
+                            for img in output_val.get("images", [])
+                        ]
+                        # Download from ComfyUI View API and Upload to S3, all images in parallel
+                        view_urls = [
+                            f"{server_address}/view?filename={img.get('filename')}"
+                            f"&subfolder={img.get('subfolder', '')}&type={img.get('type', 'output')}"
+                            for img in images
+                        ]
+                        logger.info(f"Downloading {len(view_urls)} image(s) from ComfyUI")
+                        responses = await asyncio.gather(*(self._fetch(session, u) for u in view_urls))
+                        images_result.extend(await upload_many(storage, (
+                            (f"comfy/{task_data['task_id']}/{img.get('filename')}", img_body, content_type)
+                            for img, (img_status, img_body, content_type) in zip(images, responses)
+                            if img_status == 200
+                        )))
 
         except Exception as e:
             raise EngineError(f"ComfyUI Execution Error: {e}", provider="comfyui")
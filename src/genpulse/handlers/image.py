@@ -5,23 +5,7 @@ from genpulse.handlers.base import BaseHandler
 from genpulse.handlers.registry import registry
 from genpulse import config
 from genpulse.types import TaskContext
-
-# --- Helpers / Lazy Imports ---
-# We keep these separate to avoid dependency hell if a user doesn't use a specific provider
-
-def get_volc_client():
-    try:
-        from genpulse.clients.volcengine.client import VolcEngineClient
-        return VolcEngineClient()
-    except ImportError:
-        raise ImportError("VolcEngine SDK not installed.")
-
-def get_tencent_client():
-    try:
-        from genpulse.clients.tencent.client import create_tencent_vod_client
-        return create_tencent_vod_client()
-    except ImportError:
-        raise ImportError("Tencent Cloud SDK not installed.")
+from genpulse.handlers.providers import get_volc_client, get_tencent_client
 
 
 # --- Text to Image ---
@@ -63,16 +47,16 @@ class TextToImageHandler(BaseHandler):
         elif provider == "comfyui":
             # We can import the existing logic or helper
             # To keep it "flat", we treat the old handler as a library
-            from genpulse.engines.comfy_engine import ComfyEngine
-            # We use the handler logic but manually, or we can instantiate it
+            from genpulse.engines import comfy_engine  # noqa: F401 - registers "comfyui"
+            # Engines are stateless; reuse the registry's shared instance
             # note: ComfyEngine usually expects 'workflow' in params
-            handler = ComfyEngine()
+            handler = registry.get_instance("comfyui")
             return await handler.execute(task, context)
 
         # --- Diffusers (Local) ---
         elif provider == "diffusers":
-            from genpulse.engines.diffusers_engine import DiffusersEngine
-            handler = DiffusersEngine()
+            from genpulse.engines import diffusers_engine  # noqa: F401 - registers "diffusers"
+            handler = registry.get_instance("diffusers")
             return await handler.execute(task, context)
 
         # --- Tencent VOD (Cloud) ---
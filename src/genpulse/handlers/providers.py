@@ -0,0 +1,22 @@
+from functools import cache
+
+# --- Helpers / Lazy Imports ---
+# We keep these separate to avoid dependency hell if a user doesn't use a specific provider.
+# Clients are built once per process: both wrap synchronous SDKs that are
+# safe to share, and construction (credential + profile setup) is not free.
+
+@cache
+def get_volc_client():
+    try:
+        from genpulse.clients.volcengine.client import VolcEngineClient
+        return VolcEngineClient()
+    except ImportError:
+        raise ImportError("VolcEngine SDK not installed.")
+
+@cache
+def get_tencent_client():
+    try:
+        from genpulse.clients.tencent.client import create_tencent_vod_client
+        return create_tencent_vod_client()
+    except ImportError:
+        raise ImportError("Tencent Cloud SDK not installed.")
@@ -3,12 +3,15 @@ from genpulse.handlers.base import BaseHandler
 
 class HandlerRegistry:
     _handlers: Dict[str, Type[BaseHandler]] = {}
+    # Handlers keep no per-task state, so one instance per type is reused across tasks
+    _instances: Dict[str, BaseHandler] = {}
 
     @classmethod
     def register(cls, task_type: str):
         """Decorator to register a handler class for a specific task type"""
         def decorator(handler_cls: Type[BaseHandler]):
             cls._handlers[task_type] = handler_cls
+            cls._instances.pop(task_type, None)
             return handler_cls
         return decorator
 
@@ -17,6 +20,17 @@ class HandlerRegistry:
         """Retrieve the handler class for a task type"""
         return cls._handlers.get(task_type)
 
+    @classmethod
+    def get_instance(cls, task_type: str) -> Optional[BaseHandler]:
+        """Retrieve the shared handler instance for a task type"""
+        handler = cls._instances.get(task_type)
+        if handler is None:
+            handler_cls = cls._handlers.get(task_type)
+            if handler_cls is None:
+                return None
+            handler = cls._instances[task_type] = handler_cls()
+        return handler
+
     @classmethod
     def list_handlers(cls):
         return list(cls._handlers.keys())
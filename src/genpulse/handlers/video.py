@@ -5,20 +5,7 @@ from genpulse.handlers.base import BaseHandler
 from genpulse.handlers.registry import registry
 from genpulse import config
 from genpulse.types import TaskContext
-
-def get_volc_client():
-    try:
-        from genpulse.clients.volcengine.client import VolcEngineClient
-        return VolcEngineClient()
-    except ImportError:
-        raise ImportError("VolcEngine SDK not installed.")
-
-def get_tencent_client():
-    try:
-        from genpulse.clients.tencent.client import create_tencent_vod_client
-        return create_tencent_vod_client()
-    except ImportError:
-        raise ImportError("Tencent Cloud SDK not installed.")
+from genpulse.handlers.providers import get_volc_client, get_tencent_client
 
 @registry.register("text-to-video")
 class TextToVideoHandler(BaseHandler):
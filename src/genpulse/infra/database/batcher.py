@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+from .manager import DBManager
+
+class TaskInsertBatcher:
+    """
+    Micro-batcher for new task rows.
+
+    Rows submitted within max_delay of each other (up to max_batch) are written
+    with one multi-row INSERT, so a burst of /task requests costs one round-trip
+    instead of one per task. Each caller awaits the outcome of its own row: if
+    the batch fails, its rows are retried one by one so a single bad row does
+    not fail the others.
+    """
+
+    def __init__(self, max_batch: int = 100, max_delay: float = 0.002):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._consumer: Optional[asyncio.Task] = None
+
+    async def submit(self, row: Dict[str, Any]):
+        """
+        Queue a row for insertion and wait until its batch commits.
+
+        Raises:
+            Exception: Whatever the batch INSERT raised.
+        """
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._run())
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((row, fut))
+        await fut
+
+    async def _collect(self) -> List[Tuple[Dict[str, Any], asyncio.Future]]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            try:
+                await DBManager.create_tasks([row for row, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    logger.warning(f"Insert of task {batch[0][0].get('task_id')} failed: {e}")
+                    self._settle(batch[0][1], e)
+                    continue
+                # One bad row fails the whole statement; retry row by row so
+                # only the offending rows fail and the rest still commit
+                logger.warning(f"Batched insert of {len(batch)} task(s) failed, retrying rows singly: {e}")
+                for row, fut in batch:
+                    try:
+                        await DBManager.create_tasks([row])
+                    except Exception as row_error:
+                        logger.warning(f"Insert of task {row.get('task_id')} failed: {row_error}")
+                        self._settle(fut, row_error)
+                    else:
+                        self._settle(fut)
+            else:
+                for _, fut in batch:
+                    self._settle(fut)
+
+    @staticmethod
+    def _settle(fut: asyncio.Future, error: Optional[BaseException] = None):
+        if fut.done():
+            return
+        if error is None:
+            fut.set_result(None)
+        else:
+            fut.set_exception(error)
+
+    async def close(self):
+        """Stop the consumer and fail any rows still waiting."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+        while not self._queue.empty():
+            _, fut = self._queue.get_nowait()
+            if not fut.done():
+                fut.set_exception(RuntimeError("Insert batcher closed"))
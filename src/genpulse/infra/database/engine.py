@@ -1,18 +1,46 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import DeclarativeBase
 from genpulse import config
 
-# Create async engine
+def _pool_options() -> dict:
+    """
+    Connection pool settings for the async engine.
+    SQLite (local dev / tests) keeps SQLAlchemy's default pool, since its
+    in-memory variant uses a static pool that rejects sizing arguments.
+    """
+    if config.DATABASE_URL.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+def _connect_args() -> dict:
+    """
+    Driver connect arguments. asyncpg keeps a per-connection prepared
+    statement cache, so hot task queries are parsed and planned once.
+    """
+    if config.DATABASE_URL.startswith("postgresql+asyncpg"):
+        return {"statement_cache_size": 1024, "prepared_statement_cache_size": 1024}
+    return {}
+
+# Create async engine (module-level singleton, shared by all sessions)
 engine = create_async_engine(
     config.DATABASE_URL,
-    echo=True if config.ENV == "dev" else False,
-    future=True
+    echo=config.DB_ECHO,
+    future=True,
+    connect_args=_connect_args(),
+    **_pool_options()
 )
 
 # Create session factory
 async_session = async_sessionmaker(
-    engine, 
-    class_=AsyncSession, 
+    engine,
+    class_=AsyncSession,
     expire_on_commit=False
 )
 
@@ -1,39 +1,83 @@
-from typing import Any, Dict, Optional
-from sqlalchemy import update, select
-from .engine import async_session
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert, update, select, bindparam
+from sqlalchemy.dialects import postgresql, sqlite
+from .engine import async_session, engine
 from .models import Task
 from loguru import logger
 
+
+def _build_update(with_progress: bool, with_result: bool):
+    values = {"status": bindparam("status")}
+    if with_progress:
+        values["progress"] = bindparam("progress")
+    if with_result:
+        values["result"] = bindparam("result")
+    return update(Task).where(Task.task_id == bindparam("tid")).values(**values)
+
+
+# Dialect-specific insert constructs that support ON CONFLICT
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Built once per column set so SQLAlchemy's compiled cache always hits;
+# updated_at is refreshed by the column's onupdate.
+_UPDATE_STMTS = {
+    (p, r): _build_update(p, r) for p in (False, True) for r in (False, True)
+}
+
+
 class DBManager:
     @staticmethod
-    async def create_task(task_id: str, task_type: str, params: Dict[str, Any]):
-        async with async_session() as session:
-            async with session.begin():
-                task = Task(
-                    task_id=task_id,
-                    task_type=task_type,
-                    params=params,
-                    status="pending"
-                )
-                session.add(task)
-            await session.commit()
-            return task
+    async def create_task(task_id: str, task_type: str, params: Dict[str, Any], status: str = "pending") -> str:
+        # Single INSERT ... RETURNING on a pooled connection; skips ORM unit-of-work overhead
+        stmt = insert(Task).values(
+            task_id=task_id,
+            task_type=task_type,
+            params=params,
+            status=status
+        ).returning(Task.task_id)
+        async with engine.begin() as conn:
+            result = await conn.execute(stmt)
+            return result.scalar_one()
 
     @staticmethod
-    async def update_task(task_id: str, status: str, progress: int = None, result: Dict[str, Any] = None):
-        async with async_session() as session:
-            async with session.begin():
-                stmt = update(Task).where(Task.task_id == task_id).values(
-                    status=status,
-                    updated_at=None # Let server_default handle it or specify
-                )
-                if progress is not None:
-                    stmt = stmt.values(progress=progress)
-                if result is not None:
-                    stmt = stmt.values(result=result)
-                
-                await session.execute(stmt)
-            await session.commit()
+    async def create_tasks(rows: List[Dict[str, Any]]):
+        """
+        Insert many pending tasks in one statement.
+
+        Rows whose task_id already exists are skipped (the worker may have
+        created them first), so one duplicate cannot fail the whole batch.
+
+        Args:
+            rows: Dicts with task_id, task_type and params.
+        """
+        values = [{**row, "status": row.get("status", "pending")} for row in rows]
+        make_insert = _UPSERT_INSERTS.get(engine.dialect.name)
+        async with engine.begin() as conn:
+            if make_insert is None:
+                # No ON CONFLICT here: drop rows that already exist instead
+                ids = [v["task_id"] for v in values]
+                existing = set((await conn.execute(
+                    select(Task.task_id).where(Task.task_id.in_(ids))
+                )).scalars())
+                values = [v for v in values if v["task_id"] not in existing]
+                if values:
+                    await conn.execute(insert(Task), values)
+                return
+            stmt = make_insert(Task).values(values).on_conflict_do_nothing(index_elements=["task_id"])
+            await conn.execute(stmt)
+
+    @staticmethod
+    async def update_task(task_id: str, status: str, progress: int = None, result: Dict[str, Any] = None) -> bool:
+        """Returns False when no row exists yet for task_id."""
+        stmt = _UPDATE_STMTS[(progress is not None, result is not None)]
+        params = {"tid": task_id, "status": status}
+        if progress is not None:
+            params["progress"] = progress
+        if result is not None:
+            params["result"] = result
+        async with engine.begin() as conn:
+            res = await conn.execute(stmt, params)
+            return res.rowcount > 0
 
     @staticmethod
     async def get_task(task_id: str) -> Optional[Task]:
@@ -0,0 +1,118 @@
+import asyncio
+import orjson
+import redis.asyncio as redis
+from typing import Any, Dict, Optional, Set
+from loguru import logger
+from genpulse import config
+from .batcher import TaskInsertBatcher
+
+class TaskOutbox:
+    """
+    Write-behind persistence for newly created tasks.
+
+    The gateway enqueues a task before its row exists. The INSERT then runs in
+    the background, batched with other new tasks; rows that fail to persist are parked on a Redis list and
+    retried by drain(), so the DB becomes eventually consistent with the queue.
+    """
+
+    def __init__(self, redis_url: str = None):
+        self.redis_url = redis_url or config.REDIS_URL
+        self.client = redis.from_url(self.redis_url, decode_responses=True)
+        self.key = config.TASK_OUTBOX_KEY
+        self._pending: Set[asyncio.Task] = set()
+        self.batcher = TaskInsertBatcher()
+        self._stop = asyncio.Event()
+
+    def persist(self, task_id: str, task_type: str, params: Dict[str, Any]):
+        """Schedule the INSERT for a task without waiting on it."""
+        job = asyncio.create_task(self._persist({
+            "task_id": task_id,
+            "task_type": task_type,
+            "params": params
+        }))
+        # Keep a strong reference until the insert settles
+        self._pending.add(job)
+        job.add_done_callback(self._pending.discard)
+
+    async def _insert(self, record: Dict[str, Any]) -> bool:
+        try:
+            await self.batcher.submit(record)
+        except Exception as e:
+            logger.warning(f"Deferred insert for task {record['task_id']} failed: {e}")
+            return False
+        return True
+
+    async def _persist(self, record: Dict[str, Any]):
+        if await self._insert(record):
+            return
+        try:
+            await self.client.lpush(self.key, orjson.dumps(record))
+        except Exception as e:
+            logger.error(f"Failed to park task {record['task_id']} on outbox: {e}")
+
+    async def drain(self, batch: int = 100) -> int:
+        """
+        Retry parked inserts.
+
+        Pops up to `batch` records in one round-trip (RPOP with COUNT) and
+        submits them together, so the batcher writes them as one INSERT.
+
+        Returns:
+            Number of rows persisted. Records that still fail are pushed
+            back to the consumer end in their original order.
+        """
+        raws = await self.client.rpop(self.key, batch)
+        if not raws:
+            return 0
+        results = await asyncio.gather(*(self._insert(orjson.loads(raw)) for raw in raws))
+        failed = [raw for raw, ok in zip(raws, results) if not ok]
+        if failed:
+            await self.client.rpush(self.key, *reversed(failed))
+        return len(raws) - len(failed)
+
+    async def run(self, interval: float = 5.0, max_interval: float = 60.0):
+        """
+        Drain the outbox until stop(); meant to run as a lifespan background task.
+
+        The outbox is empty almost all the time, so each empty drain doubles
+        the wait (up to max_interval) instead of polling Redis every interval;
+        a drain that persists rows resets it.
+        """
+        delay = interval
+        while not self._stop.is_set():
+            try:
+                persisted = await self.drain()
+                if persisted:
+                    logger.info(f"Outbox persisted {persisted} deferred task(s)")
+            except Exception as e:
+                persisted = 0
+                logger.error(f"Outbox drain failed: {e}")
+            delay = interval if persisted else min(delay * 2, max_interval)
+            try:
+                await asyncio.wait_for(self._stop.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        """Ask run() to exit at its next wait."""
+        self._stop.set()
+
+    async def close(self):
+        """Flush pending inserts and release Redis; get_outbox() then builds a new outbox."""
+        global _outbox
+        self.stop()
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self.batcher.close()
+        await self.client.aclose()
+        if _outbox is self:
+            _outbox = None
+
+_outbox: Optional[TaskOutbox] = None
+
+def get_outbox() -> TaskOutbox:
+    """Process-wide outbox singleton (created lazily, like get_mq())."""
+    global _outbox
+    if _outbox is None:
+        _outbox = TaskOutbox()
+    return _outbox
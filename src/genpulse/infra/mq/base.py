@@ -8,8 +8,8 @@ class BaseMQ(abc.ABC):
         pass
 
     @abc.abstractmethod
-    async def push_task(self, task_data: str):
-        """Push a JSON task string into the queue."""
+    async def push_task(self, task_data: str, priority: str = "normal"):
+        """Push a JSON task string into the queue for the given priority."""
         pass
 
     @abc.abstractmethod
@@ -19,7 +19,7 @@ class BaseMQ(abc.ABC):
 
     @abc.abstractmethod
     async def publish_event(self, task_id: str, event_data: dict):
-        """Publish a real-time event (e.g., progress update) to a channel."""
+        """Publish a real-time event (e.g., progress update) to the task event stream."""
         pass
 
     @abc.abstractmethod
@@ -23,9 +23,30 @@ celery_app.conf.update(
     task_track_started=True,
     task_acks_late=True,
     task_reject_on_worker_lost=True,  # Re-queue tasks if worker dies
-    worker_prefetch_multiplier=1,
+    worker_prefetch_multiplier=config.CELERY_PREFETCH_MULTIPLIER,
+    worker_concurrency=config.CELERY_WORKER_CONCURRENCY,
     broker_connection_retry_on_startup=True,
+    # Redis transport uses polling_interval as its BRPOP timeout (kombu default: 1s)
+    broker_transport_options={"polling_interval": config.CELERY_BRPOP_TIMEOUT},
+    task_default_queue=config.CELERY_TASK_QUEUE,
 )
 
+
+def task_queue_for(priority: str) -> str:
+    """
+    Resolve the Celery queue for a task priority.
+
+    Each priority gets its own Redis list so workers can specialize on a
+    subset of queues instead of all contending on a single key.
+    Unknown priorities fall back to the base queue.
+    """
+    if priority == "normal" or priority not in config.TASK_PRIORITIES:
+        return config.CELERY_TASK_QUEUE
+    return f"{config.CELERY_TASK_QUEUE}.{priority}"
+
+
+# All queues a general-purpose worker should consume, highest priority first
+ALL_TASK_QUEUES = [task_queue_for(p) for p in config.TASK_PRIORITIES]
+
 # Auto-discover tasks
 celery_app.autodiscover_tasks(["genpulse"])
@@ -3,50 +3,93 @@ Celery MQ adapter for GenPulse.
 
 This adapter allows GenPulse to use Celery as the task queue backend.
 """
-import json
+import asyncio
 import time
-from typing import Optional
+import orjson
+from typing import Dict, Optional, Tuple
 import redis.asyncio as redis
 
 from genpulse.infra.mq.base import BaseMQ
-from genpulse.infra.mq.celery_app import celery_app
+from genpulse.infra.mq.celery_app import celery_app, task_queue_for
+from genpulse.infra.mq.events import TaskEventHub
 from genpulse import config
 
+# Status reads are served from process memory for this long, so clients
+# polling the same task hit Redis at most once per window.
+STATUS_CACHE_TTL = 0.2
+STATUS_CACHE_MAXSIZE = 10_000
+
+
+def _redis_client(max_connections: int) -> redis.Redis:
+    """
+    Redis client backed by its own bounded connection pool.
+    Replies stay as bytes: payloads go straight to orjson.loads without a UTF-8 decode pass.
+    """
+    return redis.from_url(
+        config.REDIS_URL,
+        decode_responses=False,
+        max_connections=max_connections,
+        socket_keepalive=True,
+        health_check_interval=config.REDIS_HEALTH_CHECK_INTERVAL
+    )
+
 
 class CeleryMQ(BaseMQ):
     """
     Celery adapter for GenPulse message queue.
     
-    Uses Celery for task dispatching and Redis for status caching.
+    Uses Celery for task dispatching, Redis for status caching and a Redis
+    Stream for task events.
     Note: pop_task() is not used with Celery as workers are managed by Celery itself.
     """
     
+    # SET the status cache and append to the event stream in one round-trip.
+    # KEYS: [status_key, events_stream]  ARGV: [payload, task_id, stream_maxlen]
+    _STATUS_LUA = """
+    redis.call("SET", KEYS[1], ARGV[1], "EX", 3600)
+    redis.call("XADD", KEYS[2], "MAXLEN", "~", ARGV[3], "*", "task_id", ARGV[2], "data", ARGV[1])
+    """
+
     def __init__(self):
-        # Redis for status storage
-        self.redis_client = redis.from_url(config.REDIS_URL, decode_responses=True)
+        # Redis for status storage and event publishing (short, non-blocking ops)
+        self.redis_client = _redis_client(config.REDIS_MAX_CONNECTIONS)
+        # Separate pool for the blocking XREAD loop so it never holds a fast-path connection
+        self.stream_client = _redis_client(config.REDIS_STREAM_MAX_CONNECTIONS)
         self.status_prefix = config.TASK_STATUS_PREFIX
+        self.events_stream = config.TASK_EVENTS_STREAM
+        self.event_hub = TaskEventHub(self.stream_client, self.events_stream)
+        self._set_status = self.redis_client.register_script(self._STATUS_LUA)
+        # task_id -> (expires_at, status); insertion-ordered, oldest evicted first
+        self._status_cache: Dict[str, Tuple[float, dict]] = {}
     
     async def ping(self) -> bool:
         """Check connection to Celery broker."""
         try:
-            # Check if Celery can connect to broker
-            celery_app.connection().ensure_connection(max_retries=1)
+            # Check if Celery can connect to broker; kombu connects synchronously,
+            # so keep it off the event loop
+            await asyncio.to_thread(self._check_broker)
             return True
         except Exception:
             return False
+
+    @staticmethod
+    def _check_broker():
+        with celery_app.connection() as conn:
+            conn.ensure_connection(max_retries=1)
     
-    async def push_task(self, task_data: str):
+    async def push_task(self, task_data: str, priority: str = "normal"):
         """
         Push a task to Celery.
         
         Args:
             task_data: JSON string containing task information.
+            priority: Task priority, used to pick the queue shard.
         """
         # Send task to Celery
         celery_app.send_task(
             "genpulse.tasks.execute_task",
             args=[task_data],
-            queue="genpulse_tasks"
+            queue=task_queue_for(priority)
         )
     
     async def pop_task(self, timeout: int = 1) -> Optional[tuple]:
@@ -63,36 +106,56 @@ class CeleryMQ(BaseMQ):
     
     async def publish_event(self, task_id: str, event_data: dict):
         """
-        Publish event via Redis pub/sub.
+        Append an event to the shared Redis task event stream.
         
-        Note: Celery doesn't have built-in pub/sub, so we use Redis.
+        Note: Celery doesn't have built-in events, so we use Redis. A single
+        capped stream replaces per-task pub/sub channels; consumers fan out
+        locally via TaskEventHub.
         """
-        channel = f"{config.REDIS_PREFIX}task_updates:{task_id}"
-        await self.redis_client.publish(channel, json.dumps(event_data))
+        await self.redis_client.xadd(
+            self.events_stream,
+            {"task_id": task_id, "data": orjson.dumps(event_data)},
+            maxlen=config.TASK_EVENTS_MAXLEN,
+            approximate=True
+        )
     
     async def update_task_status(self, task_id: str, status: str, result: dict = None, progress: int = None):
-        """Update task status in Redis cache."""
-        status_key = f"{self.status_prefix}{task_id}"
+        """Update task status in Redis cache and append it to the event stream (single EVALSHA)."""
+        status_key = self.status_prefix + task_id
         data = {"status": status, "updated_at": time.time()}
         if result:
             data["result"] = result
         if progress is not None:
             data["progress"] = progress
         
-        await self.redis_client.set(status_key, json.dumps(data), ex=3600)  # Expire in 1 hour
-        await self.publish_event(task_id, data)
+        # Cache expires in 1 hour; the event shares the same serialized payload
+        await self._set_status(
+            keys=[status_key, self.events_stream],
+            args=[orjson.dumps(data), task_id, config.TASK_EVENTS_MAXLEN]
+        )
+        self._cache_status(task_id, data)
     
     async def get_task_status(self, task_id: str) -> Optional[dict]:
-        """Retrieve task status from Redis cache."""
-        status_key = f"{self.status_prefix}{task_id}"
-        data = await self.redis_client.get(status_key)
+        """Retrieve task status, via a short-lived in-process cache in front of Redis."""
+        cached = self._status_cache.get(task_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        data = await self.redis_client.get(self.status_prefix + task_id)
         if data:
-            return json.loads(data)
+            status = orjson.loads(data)
+            self._cache_status(task_id, status)
+            return status
         return None
 
+    def _cache_status(self, task_id: str, status: dict):
+        self._status_cache.pop(task_id, None)
+        if len(self._status_cache) >= STATUS_CACHE_MAXSIZE:
+            del self._status_cache[next(iter(self._status_cache))]
+        self._status_cache[task_id] = (time.monotonic() + STATUS_CACHE_TTL, status)
+
     async def send_task_wait(self, task_data: dict, timeout: int = 60) -> dict:
         """
-        Send a task and wait for its completion using Redis Pub/Sub.
+        Send a task and wait for its completion using the task event stream.
         This provides the RPC-like experience.
         """
         task_id = task_data.get("task_id")
@@ -100,39 +163,31 @@ class CeleryMQ(BaseMQ):
             raise ValueError("Task data must contain 'task_id'")
 
         # 1. Subscribe to updates FIRST to avoid race conditions
-        pubsub = self.redis_client.pubsub()
-        channel = f"{config.REDIS_PREFIX}task_updates:{task_id}"
-        await pubsub.subscribe(channel)
+        events = await self.event_hub.subscribe(task_id)
 
         try:
             # 2. Push task
             # Ensure task_data is string for push_task
-            payload = json.dumps(task_data) if isinstance(task_data, dict) else task_data
-            await self.push_task(payload)
+            payload = orjson.dumps(task_data).decode() if isinstance(task_data, dict) else task_data
+            await self.push_task(payload, priority=task_data.get("priority", "normal"))
             
             # 3. Wait loop
-            start_time = time.time()
-            while (time.time() - start_time) < timeout:
-                # Poll for message with short timeout
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.5)
-                
-                if message:
-                    try:
-                        data = json.loads(message["data"])
-                        status = data.get("status")
-                        if status in ["completed", "failed"]:
-                            return data
-                    except Exception:
-                        pass # Ignore malformed messages
-                
-        except Exception as e:
-            raise e
+            deadline = time.time() + timeout
+            while (remaining := deadline - time.time()) > 0:
+                try:
+                    data = await asyncio.wait_for(events.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                self._cache_status(task_id, data)
+                if data.get("status") in ["completed", "failed"]:
+                    return data
         finally:
-            await pubsub.unsubscribe(channel)
-            await pubsub.close()
+            self.event_hub.unsubscribe(task_id, events)
             
         raise TimeoutError(f"Task {task_id} timed out after {timeout}s")
 
     async def close(self):
-        """Close Redis connection."""
+        """Close Redis connections."""
+        await self.event_hub.close()
+        await self.stream_client.aclose()
         await self.redis_client.aclose()
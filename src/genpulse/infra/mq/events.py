@@ -0,0 +1,114 @@
+"""
+Task event fan-out for GenPulse.
+
+Status events are appended to a single Redis Stream. Each process runs at most
+one XREAD loop over that stream and dispatches entries to local asyncio queues,
+so any number of in-process waiters share one Redis connection.
+
+The reader expects a bytes-mode client (decode_responses=False): entry fields
+are matched as bytes and event payloads are handed to orjson undecoded.
+"""
+import asyncio
+from collections import defaultdict
+from typing import Dict, Optional, Set
+import orjson
+from loguru import logger
+
+
+class TaskEventHub:
+    """
+    Process-local dispatcher for the task event stream.
+
+    Subscribers register interest in a task_id and receive decoded event dicts
+    on an asyncio.Queue. The background reader is started lazily on first
+    subscription and stopped by close().
+    """
+
+    def __init__(self, redis_client, stream_key: str, block_ms: int = 5000, batch_size: int = 100):
+        self.redis_client = redis_client
+        self.stream_key = stream_key
+        self.block_ms = block_ms
+        self.batch_size = batch_size
+        # Keyed by the UTF-8 task_id, as it appears in raw stream entries
+        self._subscribers: Dict[bytes, Set[asyncio.Queue]] = defaultdict(set)
+        self._reader: Optional[asyncio.Task] = None
+        # Serializes reader start-up: concurrent subscribe() calls would otherwise
+        # each start a reader while the first is still awaiting xrevrange
+        self._reader_lock = asyncio.Lock()
+        self._last_id = b"$"
+
+    async def subscribe(self, task_id: str) -> asyncio.Queue:
+        """
+        Register a local listener for a task's events.
+
+        Args:
+            task_id: The task to listen for.
+
+        Returns:
+            A queue that receives every event published for the task from now on.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers[task_id.encode()].add(queue)
+        await self._ensure_reader()
+        return queue
+
+    def unsubscribe(self, task_id: str, queue: asyncio.Queue):
+        """Remove a listener previously returned by subscribe()."""
+        key = task_id.encode()
+        queues = self._subscribers.get(key)
+        if not queues:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[key]
+
+    async def _ensure_reader(self):
+        if self._reader is not None and not self._reader.done():
+            return
+        async with self._reader_lock:
+            if self._reader is not None and not self._reader.done():
+                return
+            # Pin the starting position before returning so events published right
+            # after subscribe() are not skipped by a late "$" resolution.
+            latest = await self.redis_client.xrevrange(self.stream_key, count=1)
+            self._last_id = latest[0][0] if latest else b"0-0"
+            self._reader = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self):
+        while True:
+            try:
+                response = await self.redis_client.xread(
+                    {self.stream_key: self._last_id},
+                    count=self.batch_size,
+                    block=self.block_ms
+                )
+            except Exception as e:
+                logger.error(f"Task event stream read failed: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            for _, entries in response or []:
+                for entry_id, fields in entries:
+                    self._last_id = entry_id
+                    self._dispatch(fields)
+
+    def _dispatch(self, fields: dict):
+        queues = self._subscribers.get(fields.get(b"task_id"))
+        if not queues:
+            return
+        try:
+            event = orjson.loads(fields[b"data"])
+        except (KeyError, orjson.JSONDecodeError):
+            return  # Ignore malformed entries
+        for queue in queues:
+            queue.put_nowait(event)
+
+    async def close(self):
+        """Stop the background reader."""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
@@ -55,6 +55,8 @@ class RateLimiter:
     return {allowed, filled}
     """
 
+    KEY_PREFIX = "genpulse:ratelimit:"
+
     def __init__(self, redis_url: str = None):
         self.redis_url = redis_url or config.REDIS_URL
         self.client = redis.from_url(self.redis_url, decode_responses=True)
@@ -80,7 +82,7 @@ class RateLimiter:
             result = await self.client.evalsha(
                 self.script_sha, 
                 1, 
-                f"genpulse:ratelimit:{key}", 
+                self.KEY_PREFIX + key, 
                 capacity, 
                 limit_per_sec, 
                 time.time()
@@ -1,21 +1,31 @@
+import io
 import os
 import abc
 import shutil
 import asyncio
-from typing import BinaryIO, Optional, Dict
+from typing import BinaryIO, Optional, Dict, Union, Iterable, List, Tuple
 from pathlib import Path
 from genpulse import config
 from loguru import logger
 
+# Copy buffer for local writes; shutil's 64 KiB default means many more syscalls for media files
+COPY_BUFSIZE = 1 << 20
+
+# Parallel uploads per call; stays well under the S3 client's connection pool
+UPLOAD_CONCURRENCY = 8
+
+# In-memory payloads (generated images, decoded uploads) can be passed as-is
+Content = Union[bytes, bytearray, memoryview, BinaryIO]
+
 class BaseStorage(abc.ABC):
     @abc.abstractmethod
-    async def upload(self, file_path: str, content: BinaryIO, content_type: Optional[str] = None, metadata: Dict[str, str] = None) -> str:
+    async def upload(self, file_path: str, content: Content, content_type: Optional[str] = None, metadata: Dict[str, str] = None) -> str:
         """
         Upload file to storage.
         
         Args:
             file_path: Relative path/key.
-            content: File-like object (binary).
+            content: Raw bytes or a binary file-like object.
             content_type: MIME type of the file.
             metadata: Custom metadata (key-value pairs) to attach to the file.
             
@@ -41,11 +51,11 @@ class LocalStorageProvider(BaseStorage):
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.base_url = config.STORAGE_BASE_URL
 
-    async def upload(self, file_path: str, content: BinaryIO, content_type: Optional[str] = None, metadata: Dict[str, str] = None) -> str:
+    async def upload(self, file_path: str, content: Content, content_type: Optional[str] = None, metadata: Dict[str, str] = None) -> str:
         # Resolve the full path and ensure parent directories exist
         full_path = (self.base_path / file_path).resolve()
         
-        if not str(full_path).startswith(str(self.base_path)):
+        if not full_path.is_relative_to(self.base_path):
             raise ValueError(f"Path traversal attempt: {file_path}")
             
         # Offload blocking I/O to thread
@@ -56,12 +66,48 @@ class LocalStorageProvider(BaseStorage):
         return await self.get_url(file_path)
         
     def _write_file(self, path, content):
-        path.parent.mkdir(parents=True, exist_ok=True)
+        # Open optimistically; only create parent directories when they are missing
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            # Raw fd writes, no buffered file object in between
+            try:
+                view = memoryview(content)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            return
         # Ensure pointer is at start if it was read before
         if content.seekable():
              content.seek(0)
-        with open(path, "wb") as f:
-            shutil.copyfileobj(content, f)
+        with open(fd, "wb") as f:
+            if not self._sendfile(content, f):
+                shutil.copyfileobj(content, f, COPY_BUFSIZE)
+
+    @staticmethod
+    def _sendfile(src: BinaryIO, dst: BinaryIO) -> bool:
+        """Kernel-side copy when the source is a real file; returns False to fall back."""
+        try:
+            src_fd = src.fileno()
+            size = os.fstat(src_fd).st_size
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return False
+        offset = src.tell()
+        try:
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset != src.tell():
+                raise  # Partial copy; can't fall back safely
+            return False
+        return True
 
     async def delete(self, file_path: str) -> bool:
         full_path = self.base_path / file_path
@@ -78,6 +124,8 @@ class S3StorageProvider(BaseStorage):
     def __init__(self):
         try:
             import boto3
+            from botocore.config import Config
+            from boto3.s3.transfer import TransferConfig
         except ImportError:
             raise RuntimeError("boto3 is not installed. Please install it to use S3StorageProvider.")
             
@@ -89,11 +137,20 @@ class S3StorageProvider(BaseStorage):
             endpoint_url=config.S3_ENDPOINT_URL,
             aws_access_key_id=config.S3_ACCESS_KEY,
             aws_secret_access_key=config.S3_SECRET_KEY,
-            region_name=config.S3_REGION_NAME
+            region_name=config.S3_REGION_NAME,
+            # Enough pooled connections for concurrent multipart parts across uploads
+            config=Config(max_pool_connections=32)
+        )
+        # Large objects are split into 8 MiB parts uploaded in parallel
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 << 20,
+            multipart_chunksize=8 << 20,
+            max_concurrency=8,
+            use_threads=True
         )
         logger.info(f"Initialized S3 Storage (Bucket: {self.bucket})")
 
-    async def upload(self, file_path: str, content: BinaryIO, content_type: Optional[str] = None, metadata: Dict[str, str] = None) -> str:
+    async def upload(self, file_path: str, content: Content, content_type: Optional[str] = None, metadata: Dict[str, str] = None) -> str:
         extra_args = {}
         if content_type:
             extra_args['ContentType'] = content_type
@@ -101,7 +158,21 @@ class S3StorageProvider(BaseStorage):
             # S3 Metadata must be strings
             extra_args['Metadata'] = {k: str(v) for k, v in metadata.items()}
 
-        if content.seekable():
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            if len(content) < self.transfer_config.multipart_threshold:
+                # Single PUT straight from memory; skips the transfer manager's
+                # thread pool and read buffers
+                await asyncio.to_thread(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket,
+                    Key=file_path,
+                    Body=bytes(content),
+                    **extra_args
+                )
+                logger.info(f"Uploaded {file_path} to S3")
+                return await self.get_url(file_path)
+            content = io.BytesIO(content)
+        elif content.seekable():
              content.seek(0)
 
         await asyncio.to_thread(
@@ -109,7 +180,8 @@ class S3StorageProvider(BaseStorage):
             content,
             self.bucket,
             file_path,
-            ExtraArgs=extra_args
+            ExtraArgs=extra_args,
+            Config=self.transfer_config
         )
         logger.info(f"Uploaded {file_path} to S3")
         return await self.get_url(file_path)
@@ -127,10 +199,10 @@ class S3StorageProvider(BaseStorage):
             return False
 
     async def get_url(self, file_path: str) -> str:
-        # Generate presigned URL valid for 1 hour (3600 seconds)
+        # Generate presigned URL valid for 1 hour (3600 seconds).
+        # Signing is local CPU work with no network call, so no thread hop is needed.
         try:
-            url = await asyncio.to_thread(
-                self.s3_client.generate_presigned_url,
+            url = self.s3_client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket, 'Key': file_path},
                 ExpiresIn=3600
@@ -140,6 +212,25 @@ class S3StorageProvider(BaseStorage):
             logger.error(f"Failed to generate presigned URL: {e}")
             return ""
 
+async def upload_many(
+    storage: BaseStorage,
+    files: Iterable[Tuple[str, Content, Optional[str]]],
+    limit: int = UPLOAD_CONCURRENCY
+) -> List[str]:
+    """
+    Upload (file_path, content, content_type) entries concurrently.
+
+    Returns:
+        URLs in the same order as files.
+    """
+    sem = asyncio.Semaphore(limit)
+
+    async def _upload(file_path, content, content_type):
+        async with sem:
+            return await storage.upload(file_path, content, content_type=content_type)
+
+    return list(await asyncio.gather(*(_upload(*f) for f in files)))
+
 _storage_instance: Optional[BaseStorage] = None
 
 def get_storage() -> BaseStorage:
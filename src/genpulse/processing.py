@@ -4,20 +4,57 @@ Task Processing Logic
 This module contains the core task processing logic extracted from Worker.
 It can be used by both the native Worker and Celery tasks.
 """
-import json
+import orjson
 import importlib
-import os
+import pkgutil
+import time
 import asyncio
 from typing import Optional
 from loguru import logger
 
+from genpulse import handlers as handlers_pkg
 from genpulse.handlers.registry import registry
 from genpulse.infra.database.manager import DBManager
 from genpulse.infra.mq import get_mq
 from genpulse.infra.rate_limiter import RateLimiter
-from genpulse.config import RATE_LIMITS
+from genpulse.config import RATE_LIMITS, DEFAULT_RATE_LIMIT
+from sqlalchemy.exc import IntegrityError
 from genpulse.types import TaskContext, TaskStatus, EngineError, RateLimitExceeded, TransientError
 
+# Progress-only updates are coalesced unless they move at least this many
+# percentage points or this many seconds have passed since the last flush.
+PROGRESS_FLUSH_STEP = 5
+PROGRESS_FLUSH_INTERVAL = 0.25
+# While a task runs, Postgres gets a progress snapshot at most this often (seconds)
+DB_SNAPSHOT_INTERVAL = 2.0
+
+# Helper modules in genpulse.handlers that register nothing
+_NON_HANDLER_MODULES = {"base", "registry", "providers"}
+_handlers_discovered = False
+
+
+def discover_handlers():
+    """
+    Import every module in the handlers/ package to trigger registration.
+    Runs once per process; call it early (e.g. in the Celery parent before
+    the pool forks) so workers start with handlers already imported.
+    """
+    global _handlers_discovered
+    if _handlers_discovered:
+        return
+
+    for module in pkgutil.iter_modules(handlers_pkg.__path__, prefix=f"{handlers_pkg.__name__}."):
+        if module.name.rsplit(".", 1)[-1] in _NON_HANDLER_MODULES:
+            continue
+        try:
+            importlib.import_module(module.name)
+            logger.info(f"Loaded handlers from {module.name}")
+        except Exception as e:
+            logger.error(f"Failed to load handlers from {module.name}: {e}")
+
+    _handlers_discovered = True
+    logger.info(f"Registered handlers: {registry.list_handlers()}")
+
 
 class TaskProcessor:
     """
@@ -30,30 +67,6 @@ class TaskProcessor:
     def __init__(self):
         self.mq = get_mq()
         self.rate_limiter = RateLimiter()
-        self._handlers_discovered = False
-    
-    def _discover_handlers(self):
-        """Automatically import all modules in the handlers/ directory to trigger registration"""
-        if self._handlers_discovered:
-            return
-            
-        handlers_dir = os.path.join(os.path.dirname(__file__), "handlers")
-        if not os.path.exists(handlers_dir):
-            logger.warning(f"Handlers directory not found: {handlers_dir}")
-            return
-
-        for file in os.listdir(handlers_dir):
-            if file.endswith(".py") and file not in ["__init__.py", "base.py", "registry.py"]:
-                module_name = file[:-3]
-                module_path = f"genpulse.handlers.{module_name}"
-                try:
-                    importlib.import_module(module_path)
-                    logger.info(f"Loaded handlers from {module_path}")
-                except Exception as e:
-                    logger.error(f"Failed to load handlers from {module_path}: {e}")
-        
-        self._handlers_discovered = True
-        logger.info(f"Registered handlers: {registry.list_handlers()}")
     
     async def process(self, task_json: str) -> Optional[dict]:
         """
@@ -69,19 +82,19 @@ class TaskProcessor:
             RateLimitExceeded: If flow control limits are hit (caller should retry).
         """
         # Ensure handlers are discovered
-        self._discover_handlers()
+        discover_handlers()
         
         task_data = {}
         try:
-            task_data = json.loads(task_json)
-        except json.JSONDecodeError:
+            task_data = orjson.loads(task_json)
+        except orjson.JSONDecodeError:
             logger.error("Failed to decode task JSON")
             return None
 
         # Rate Limit Check
         params = task_data.get("params", {})
         provider = params.get("provider", "default")
-        limit = RATE_LIMITS.get(provider, RATE_LIMITS.get("default", 10.0))
+        limit = RATE_LIMITS.get(provider, DEFAULT_RATE_LIMIT)
         
         if not await self.rate_limiter.acquire(provider, limit):
             logger.warning(f"Rate limit exceeded for {provider}. Requesting retry.")
@@ -91,13 +104,61 @@ class TaskProcessor:
             task_id = task_data.get("task_id")
             task_type = task_data.get("task_type")
 
+            last_status, last_progress, last_flush = None, None, 0.0
+            last_persist = 0.0
+            # Payload (e.g. an info message) of the latest throttled tick
+            held_result = None
+
             # Helper to allow handler/engine to update status/progress
             async def update_status_func(status: str, progress: int = None, result: dict = None):
-                # Update MQ Cache for real-time status query
-                await self.mq.update_task_status(task_id, status, result=result, progress=progress)
-                # Update DB for persistence
+                nonlocal last_status, last_progress, last_flush, last_persist, held_result
+                now = time.monotonic()
+                # Throttle progress ticks; status transitions always go through
+                if (
+                    status not in (TaskStatus.COMPLETED, TaskStatus.FAILED)
+                    and status == last_status
+                    and progress is not None
+                    and last_progress is not None
+                    and progress - last_progress < PROGRESS_FLUSH_STEP
+                    and now - last_flush < PROGRESS_FLUSH_INTERVAL
+                ):
+                    # Hold the payload so the next update sent carries it
+                    if result is not None:
+                        held_result = result
+                    return
+                transition = status != last_status
+                if result is None and not transition:
+                    result = held_result
+                held_result = None
+                last_status, last_flush = status, now
+                if progress is not None:
+                    last_progress = progress
+
+                # Redis owns live progress (and its info messages); Postgres gets
+                # transitions, terminal results and a periodic snapshot
+                if not (
+                    transition
+                    or status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
+                    or now - last_persist >= DB_SNAPSHOT_INTERVAL
+                ):
+                    await self.mq.update_task_status(task_id, status, result=result, progress=progress)
+                    return
+                last_persist = now
+                # MQ cache and DB writes are independent; overlap their round-trips
+                await asyncio.gather(
+                    self.mq.update_task_status(task_id, status, result=result, progress=progress),
+                    persist_status(status, progress, result)
+                )
+
+            async def persist_status(status: str, progress: Optional[int], result: Optional[dict]):
                 try:
-                    await DBManager.update_task(task_id, status, progress=progress, result=result)
+                    if not await DBManager.update_task(task_id, status, progress=progress, result=result):
+                        # The gateway inserts rows write-behind; create it if we got here first
+                        try:
+                            await DBManager.create_task(task_id, task_type, params, status=status)
+                        except IntegrityError:
+                            pass
+                        await DBManager.update_task(task_id, status, progress=progress, result=result)
                 except Exception as e:
                     logger.error(f"Failed to update task {task_id} in DB: {e}")
 
@@ -108,16 +169,14 @@ class TaskProcessor:
 
             logger.info(f"Processing task {task_id} ({task_type})")
 
-            HandlerClass = registry.get_handler(task_type)
-            if not HandlerClass:
+            handler = registry.get_instance(task_type)
+            if handler is None:
                 logger.error(f"No handler registered for type: {task_type}")
                 await context.set_failed(f"Handler for {task_type} not found")
                 return None
 
             # Update status to processing (init)
             await context.set_processing(progress=0, info="Started")
-
-            handler = HandlerClass()
             
             # 1. Validate
             if not handler.validate_params(params):
@@ -143,7 +202,7 @@ class TaskProcessor:
             logger.exception(f"Failed to process task: {msg}")
             
             # Attempt to update status to failed if we have a task_id
-            if 'task_id' in locals() and task_data:
+            if 'update_status_func' in locals():
                 try:
                     # If it's an EngineError, we might have more details
                     error_details = {"error": msg}
@@ -151,8 +210,8 @@ class TaskProcessor:
                         error_details.update(e.details)
                         error_details["provider"] = e.provider
                     
-                    await self.mq.update_task_status(task_data["task_id"], TaskStatus.FAILED, result=error_details)
-                    await DBManager.update_task(task_data["task_id"], TaskStatus.FAILED, result=error_details)
+                    # Same path as handler updates: MQ and DB writes overlap, missing rows are created
+                    await update_status_func(TaskStatus.FAILED, result=error_details)
                 except Exception as db_err:
                     logger.error(f"Double fault: failed to update fail status in DB: {db_err}")
             
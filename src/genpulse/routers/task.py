@@ -2,10 +2,11 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, List, Literal
 import uuid
-import json
+import orjson
 from loguru import logger
 from genpulse.infra.mq import get_mq
 from genpulse.infra.database.manager import DBManager
+from genpulse.infra.database.outbox import get_outbox
 from genpulse import config
 
 router = APIRouter(prefix="/task", tags=["tasks"])
@@ -16,22 +17,16 @@ from genpulse.schemas.request import TaskRequest
 
 from genpulse.utils.upload_helper import process_base64_inputs
 
-@router.post("")
+@router.post("", status_code=202)
 async def create_task(req: TaskRequest):
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
     
     # 0. Handle Base64 Uploads
     # Convert params to dict and scan for Base64 Data URIs to upload
     raw_params = req.params.model_dump()
     processed_params = await process_base64_inputs(raw_params)
     
-    # 1. Persist to DB
-    try:
-        await DBManager.create_task(task_id, req.task_type, processed_params)
-    except Exception as e:
-        logger.error(f"DB Error: {e}")
-    
-    # 2. Push to MQ
+    # 1. Record the pending status and push to MQ (the request's critical path)
     task_data = {
         "task_id": task_id,
         "task_type": req.task_type,
@@ -42,15 +37,22 @@ async def create_task(req: TaskRequest):
     }
     
     try:
-        await mq.push_task(json.dumps(task_data))
-        return {
-            "task_id": task_id,
-            "status": "pending",
-            "message": "Task received and queued"
-        }
+        # Seed the status cache first so GET /task/{id} answers while the row is
+        # still being written; the worker's own updates land after this one
+        await mq.update_task_status(task_id, "pending")
+        await mq.push_task(orjson.dumps(task_data).decode(), priority=req.priority)
     except Exception as e:
+        logger.error(f"Failed to enqueue task {task_id}: {e}")
         raise HTTPException(status_code=500, detail=f"MQ Error: {str(e)}")
 
+    # 2. Persist to DB write-behind; failed inserts are retried from the outbox
+    get_outbox().persist(task_id, req.task_type, processed_params)
+    return {
+        "task_id": task_id,
+        "status": "pending",
+        "message": "Task received and queued"
+    }
+
 @router.get("/{task_id}")
 async def get_task_status(task_id: str):
     # 1. Try MQ Cache
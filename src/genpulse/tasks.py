@@ -4,12 +4,53 @@ Celery tasks for GenPulse.
 This module defines Celery tasks that wrap the TaskProcessor logic.
 """
 import asyncio
+from typing import Optional
+from loguru import logger
+from celery.signals import worker_init, worker_process_shutdown
 from genpulse.infra.mq.celery_app import celery_app
-from genpulse.processing import TaskProcessor
+from genpulse.processing import TaskProcessor, discover_handlers
 
 
 from genpulse.types import RateLimitExceeded, TransientError
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
+# One event loop per worker process, reused by every task it runs
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+@worker_init.connect
+def preload_handlers(**kwargs):
+    """Import handler modules in the worker parent so forked children inherit them."""
+    discover_handlers()
+
+async def _close_http_clients():
+    from genpulse.handlers.comfy_handler import ComfyUIHandler
+    from genpulse.engines.comfy_engine import ComfyEngine
+    from genpulse.clients.base import BaseClient
+    await ComfyUIHandler.close_session()
+    await BaseClient.close_http()
+    await ComfyEngine.close_pools()
+
+@worker_process_shutdown.connect
+def close_http_clients(**kwargs):
+    """Close pooled HTTP sessions shared across tasks before the process exits."""
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        _loop.run_until_complete(_close_http_clients())
+    except Exception as e:
+        logger.warning(f"Failed to close HTTP clients on shutdown: {e}")
+
 @celery_app.task(name="genpulse.tasks.execute_task", bind=True)
 def execute_task(self, task_json: str):
     """
@@ -24,11 +65,7 @@ def execute_task(self, task_json: str):
     processor = TaskProcessor()
     
     # Run async processing in sync context
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    loop = _get_loop()
     
     try:
         result = loop.run_until_complete(processor.process(task_json))
@@ -9,6 +9,15 @@ class WorkflowParam(BaseModel):
     default: Any = None
     description: str = ""
 
+# Mapping of Node Class -> Primary Input Field
+PRIMARY_FIELDS = {
+    "CLIPTextEncode": "text",
+    "KSampler": "seed",
+    "LoadImage": "image",
+    "EmptyLatentImage": ["width", "height"], # Special case
+    "PrimitiveNode": "value", # If using primitive nodes
+}
+
 def parse_workflow_template(workflow: Dict[str, Any]) -> List[WorkflowParam]:
     """
     Parses a ComfyUI API-JSON workflow.
@@ -24,15 +33,6 @@ def parse_workflow_template(workflow: Dict[str, Any]) -> List[WorkflowParam]:
     """
     params = []
     
-    # Mapping of Node Class -> Primary Input Field
-    PRIMARY_FIELDS = {
-        "CLIPTextEncode": "text",
-        "KSampler": "seed",
-        "LoadImage": "image",
-        "EmptyLatentImage": ["width", "height"], # Special case
-        "PrimitiveNode": "value", # If using primitive nodes
-    }
-    
     for node_id, node in workflow.items():
         meta = node.get("_meta", {})
         title = meta.get("title", "")
@@ -89,15 +89,24 @@ def apply_params(workflow: Dict[str, Any], params_map: Dict[str, Any], schema: L
     """
     Injects values into the workflow based on the schema and provided params.
     Returns a new workflow dict ready for execution.
+
+    Copy-on-write: only the nodes that receive a value (and their "inputs")
+    are copied; untouched nodes are shared with the template, which must be
+    treated as read-only.
     """
-    import copy
-    wf = copy.deepcopy(workflow)
+    wf = dict(workflow)
+    copied = set()
     
     for param in schema:
         if param.name in params_map:
             val = params_map[param.name]
             # Type casting if needed could go here
-            if node := wf.get(param.node_id):
-                node["inputs"][param.field_path] = val
+            node = wf.get(param.node_id)
+            if not node:
+                continue
+            if param.node_id not in copied:
+                node = wf[param.node_id] = {**node, "inputs": dict(node.get("inputs", {}))}
+                copied.add(param.node_id)
+            node["inputs"][param.field_path] = val
                 
     return wf
@@ -0,0 +1,86 @@
+import asyncio
+from typing import Optional, Tuple
+from loguru import logger
+from genpulse.types import TaskContext
+
+class ProgressReporter:
+    """
+    Latest-value-wins progress channel for a running task.
+
+    Producers call report() (or report_threadsafe() from a worker thread, e.g.
+    a diffusion step callback) without awaiting any I/O. A single background
+    consumer writes the most recent value through context.set_processing();
+    intermediate values that arrive while a write is in flight are dropped.
+
+    Usage:
+        async with ProgressReporter(context) as progress:
+            progress.report(42, info="Sampling")
+    """
+
+    def __init__(self, context: TaskContext):
+        self.context = context
+        self._latest: Optional[Tuple[Optional[int], Optional[str]]] = None
+        self._wakeup = asyncio.Event()
+        self._consumer: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing = False
+
+    async def __aenter__(self) -> "ProgressReporter":
+        self._loop = asyncio.get_running_loop()
+        self._consumer = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def report(self, progress: Optional[int], info: str = None):
+        """Record a progress value; never blocks. Must be called on the event loop."""
+        self._latest = (progress, info)
+        self._wakeup.set()
+
+    def report_threadsafe(self, progress: Optional[int], info: str = None):
+        """Same as report(), callable from threads other than the event loop."""
+        self._loop.call_soon_threadsafe(self.report, progress, info)
+
+    def step_callback(self, total_steps: int, start: int = 10, span: int = 75, info: str = "Denoising"):
+        """
+        Build a diffusers callback_on_step_end that reports from the pipeline thread.
+
+        Percentages are precomputed, and the event loop is only woken when the
+        integer percentage changes, so most denoising steps cost a list lookup.
+        """
+        table = [start + (step * span) // max(total_steps, 1) for step in range(total_steps + 1)]
+        last = [None]
+
+        def callback(pipe, step: int, timestep, callback_kwargs):
+            p = table[min(step + 1, total_steps)]
+            if p != last[0]:
+                last[0] = p
+                self.report_threadsafe(p, info=info)
+            return callback_kwargs
+
+        return callback
+
+    async def _flush(self):
+        latest, self._latest = self._latest, None
+        if latest is None:
+            return
+        try:
+            await self.context.set_processing(latest[0], info=latest[1])
+        except Exception as e:
+            logger.warning(f"Progress update for task {self.context.task_id} failed: {e}")
+
+    async def _run(self):
+        while not self._closing:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            await self._flush()
+
+    async def aclose(self):
+        """Let an in-flight write finish, then write the last pending value, if any."""
+        self._closing = True
+        if self._consumer is not None:
+            self._wakeup.set()
+            await self._consumer
+            self._consumer = None
+        await self._flush()
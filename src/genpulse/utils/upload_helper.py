@@ -1,6 +1,5 @@
 import base64
 import re
-import io
 import uuid
 import asyncio
 from typing import Dict, Any, Union, List
@@ -47,7 +46,7 @@ async def process_base64_inputs(data: Union[Dict, List, Any]) -> Any:
                 
                 filename = f"uploads/b64_{uuid.uuid4()}.{ext}"
                 
-                url = await storage.upload(filename, io.BytesIO(binary_data), content_type=mime_type)
+                url = await storage.upload(filename, binary_data, content_type=mime_type)
                 return url
                 
             except Exception as e:
@@ -41,9 +41,9 @@ async def test_worker_sync_db_and_redis(mock_redis_mgr, mock_db_manager):
             return {"video_url": "http://mock.com/vid.mp4"}
             
     # Save original handler getter
-    original_get = registry.get_handler
+    original_get = registry.get_instance
     # Patch registry
-    registry.get_handler = lambda t: MockHandler
+    registry.get_instance = lambda t: MockHandler()
     
     try:
         # Run process
@@ -67,4 +67,70 @@ async def test_worker_sync_db_and_redis(mock_redis_mgr, mock_db_manager):
 
     finally:
         # Restore registry
-        registry.get_handler = original_get
+        registry.get_instance = original_get
+
+@pytest.mark.asyncio
+async def test_worker_progress_ticks_skip_db(mock_redis_mgr, monkeypatch):
+    """Progress ticks with info messages reach Redis but not Postgres."""
+    db = AsyncMock()
+    db.update_task.return_value = True
+    monkeypatch.setattr("genpulse.processing.DBManager", db)
+
+    processor = TaskProcessor()
+    processor.rate_limiter = AsyncMock()
+    processor.rate_limiter.acquire.return_value = True
+    processor.mq = mock_redis_mgr
+
+    class TickingHandler(BaseHandler):
+        def validate_params(self, params): return True
+        async def execute(self, task, context):
+            for p in range(5, 100, 5):
+                await context.set_processing(p, info=f"Step {p}")
+            return {"ok": True}
+
+    original_get = registry.get_instance
+    registry.get_instance = lambda t: TickingHandler()
+    try:
+        await processor.process(json.dumps({"task_id": "tick", "task_type": "x", "params": {}}))
+    finally:
+        registry.get_instance = original_get
+
+    statuses = [c.args[1] for c in db.update_task.call_args_list]
+    # processing transition + completion only
+    assert statuses == [TaskStatus.PROCESSING, TaskStatus.COMPLETED]
+    assert mock_redis_mgr.update_task_status.call_count > len(statuses)
+
+@pytest.mark.asyncio
+async def test_worker_throttled_tick_info_is_carried_forward(mock_redis_mgr, monkeypatch):
+    """An info message on a throttled tick rides along with the next update sent."""
+    db = AsyncMock()
+    db.update_task.return_value = True
+    monkeypatch.setattr("genpulse.processing.DBManager", db)
+
+    processor = TaskProcessor()
+    processor.rate_limiter = AsyncMock()
+    processor.rate_limiter.acquire.return_value = True
+    processor.mq = mock_redis_mgr
+
+    class InfoHandler(BaseHandler):
+        def validate_params(self, params): return True
+        async def execute(self, task, context):
+            await context.set_processing(10)
+            await context.set_processing(11, info="Loading model")  # throttled
+            await context.update_status(TaskStatus.PROCESSING, 20, None)
+            return {"ok": True}
+
+    original_get = registry.get_instance
+    registry.get_instance = lambda t: InfoHandler()
+    try:
+        await processor.process(json.dumps({"task_id": "info", "task_type": "x", "params": {}}))
+    finally:
+        registry.get_instance = original_get
+
+    sent = [
+        (c.kwargs.get("progress"), c.kwargs.get("result"))
+        for c in mock_redis_mgr.update_task_status.call_args_list
+        if c.args[1] == TaskStatus.PROCESSING
+    ]
+    assert (11, {"info": "Loading model"}) not in sent
+    assert (20, {"info": "Loading model"}) in sent
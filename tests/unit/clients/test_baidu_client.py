@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+import hmac
+import orjson
+from genpulse.clients.baidu.client import BaiduVodClient, _StatusBatcher
+
+def test_auth_header_matches_bce_v1(mocker):
+    """Test that the cached signing path produces the documented BCE-AUTH-V1 signature."""
+    mocker.patch("time.time", return_value=1430123029.0)
+    client = BaiduVodClient(ak="ak", sk="sk")
+    date = client._get_bce_date()
+    assert date == "2015-04-27T08:23:49Z"
+
+    prefix = f"bce-auth-v1/ak/{date}/1800"
+    key = hmac.new(b"sk", prefix.encode(), hashlib.sha256).hexdigest()
+    canonical = (
+        "GET\n/v2/aigc/task/t%201\npn=1&ps=20\n"
+        "host:vod.baidubce.com\nx-bce-date:2015-04-27T08%3A23%3A49Z"
+    )
+    signature = hmac.new(key.encode(), canonical.encode(), hashlib.sha256).hexdigest()
+
+    auth = client._get_auth_header("GET", "/v2/aigc/task/t 1", {"pn": 1, "ps": 20}, date)
+    assert auth == f"{prefix}/host;x-bce-date/{signature}"
+
+def test_raw_image_bytes_are_base64_encoded_in_body():
+    """Test that raw image bytes are encoded only when the submit body is serialized."""
+    from genpulse.clients.baidu.schemas import BaiduAigcImageInput
+    task_input = BaiduAigcImageInput(image=b"\x89PNG", imageTail="https://x/y.png")
+    assert task_input.image == b"\x89PNG"
+    body = orjson.loads(task_input.model_dump_json(exclude_none=True))
+    assert body["image"] == "iVBORw=="
+    assert body["imageTail"] == "https://x/y.png"
+
+def _status(task_id: str, status: str = "PROCESSING"):
+    from genpulse.clients.baidu.schemas import BaiduStatusResponse
+    return BaiduStatusResponse(taskId=task_id, status=status)
+
+def _batcher_client(mocker, get_task):
+    """Client whose get_task("lead") blocks until released, keeping a direct poll in flight."""
+    client = BaiduVodClient(ak="ak", sk="sk")
+    release = asyncio.Event()
+
+    async def fake_get_task(task_id):
+        if task_id == "lead":
+            await release.wait()
+            return _status("lead")
+        return await get_task(task_id)
+    client.get_task = mocker.AsyncMock(side_effect=fake_get_task)
+    return client, release
+
+async def test_status_batcher_lone_poll_skips_window(mocker):
+    """Test that a poll with nothing else in flight goes straight to get_task."""
+    client = BaiduVodClient(ak="ak", sk="sk")
+    client._list_tasks_raw = mocker.AsyncMock()
+    client.get_task = mocker.AsyncMock(return_value=_status("a", "SUCCESS"))
+    batcher = _StatusBatcher(client, window=10)
+
+    result = await asyncio.wait_for(batcher.get("a"), 1)
+
+    assert result.status == "SUCCESS"
+    client.get_task.assert_awaited_once_with("a")
+    client._list_tasks_raw.assert_not_awaited()
+
+async def test_status_batcher_resolves_listed_tasks_in_one_call(mocker):
+    """Test that polls overlapping an in-flight poll are answered from a single list request."""
+    client, release = _batcher_client(mocker, mocker.AsyncMock())
+    client._list_tasks_raw = mocker.AsyncMock(return_value={"tasks": [
+        {"taskId": "a", "status": "SUCCESS"},
+        {"taskId": "b", "status": "PROCESSING"},
+        {"taskId": "other", "status": "FAILED"},
+    ]})
+    batcher = _StatusBatcher(client, window=0.01, page_size=50)
+
+    lead = asyncio.create_task(batcher.get("lead"))
+    await asyncio.sleep(0)
+    a1, b, a2 = await asyncio.gather(batcher.get("a"), batcher.get("b"), batcher.get("a"))
+    release.set()
+    await lead
+
+    assert a1.status == "SUCCESS" and a2 is a1
+    assert b.status == "PROCESSING"
+    client._list_tasks_raw.assert_awaited_once_with(pn=1, ps=50)
+    client.get_task.assert_awaited_once_with("lead")
+
+async def test_status_batcher_falls_back_for_unlisted_tasks(mocker):
+    """Test that tasks missing from the listed page are fetched individually."""
+    client, release = _batcher_client(mocker, mocker.AsyncMock(return_value=_status("old", "FAILED")))
+    client._list_tasks_raw = mocker.AsyncMock(return_value={"tasks": [{"taskId": "a", "status": "SUCCESS"}]})
+    batcher = _StatusBatcher(client, window=0.01)
+
+    lead = asyncio.create_task(batcher.get("lead"))
+    await asyncio.sleep(0)
+    a, old = await asyncio.gather(batcher.get("a"), batcher.get("old"))
+    release.set()
+    await lead
+
+    assert a.status == "SUCCESS"
+    assert old.status == "FAILED"
+    assert [c.args[0] for c in client.get_task.await_args_list] == ["lead", "old"]
+
+async def test_status_batcher_list_failure_reaches_every_waiter(mocker):
+    """Test that a failed list request leaves no waiter hanging: each one is polled or gets the error."""
+    client, release = _batcher_client(mocker, mocker.AsyncMock(side_effect=ConnectionError("get down")))
+    client._list_tasks_raw = mocker.AsyncMock(side_effect=ConnectionError("list down"))
+    batcher = _StatusBatcher(client, window=0.01)
+
+    lead = asyncio.create_task(batcher.get("lead"))
+    await asyncio.sleep(0)
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.get("a"), batcher.get("b"), batcher.get("a"), return_exceptions=True), 1
+    )
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert sorted(c.args[0] for c in client.get_task.await_args_list) == ["a", "b", "lead"]
+
+    # Once the list call recovers, the next window is batched again
+    client._list_tasks_raw.side_effect = None
+    client._list_tasks_raw.return_value = {"tasks": [{"taskId": "a", "status": "SUCCESS"}, {"taskId": "b", "status": "FAILED"}]}
+    a, b = await asyncio.gather(batcher.get("a"), batcher.get("b"))
+    assert (a.status, b.status) == ("SUCCESS", "FAILED")
+    release.set()
+    await lead
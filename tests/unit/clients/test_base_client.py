@@ -0,0 +1,125 @@
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from genpulse.clients.base import BaseClient
+
+@pytest.mark.asyncio
+async def test_poll_task_backs_off_to_interval(mocker):
+    """Polling starts fast and doubles the wait up to the configured interval."""
+    sleep = mocker.patch("genpulse.clients.base.asyncio.sleep", new=AsyncMock())
+    mocker.patch("genpulse.clients.base.random.uniform", return_value=0)
+    statuses = iter(["running"] * 5 + ["done"])
+
+    result = await BaseClient().poll_task(
+        "t1",
+        get_status_func=AsyncMock(side_effect=lambda _: next(statuses)),
+        check_success_func=lambda s: s == "done",
+        check_failed_func=lambda s: False,
+        interval=5
+    )
+
+    assert result == "done"
+    assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0, 4.0, 5, 5]
+
+@pytest.mark.asyncio
+async def test_poll_task_honors_retry_after(mocker):
+    """A throttled status query waits for the provider's Retry-After instead of the backoff."""
+    sleep = mocker.patch("genpulse.clients.base.asyncio.sleep", new=AsyncMock())
+    mocker.patch("genpulse.clients.base.random.uniform", return_value=0)
+    request = httpx.Request("GET", "https://example.com/task/t1")
+    throttled = httpx.HTTPStatusError(
+        "429", request=request,
+        response=httpx.Response(429, headers={"Retry-After": "7"}, request=request)
+    )
+
+    result = await BaseClient().poll_task(
+        "t1",
+        get_status_func=AsyncMock(side_effect=[throttled, "running", "done"]),
+        check_success_func=lambda s: s == "done",
+        check_failed_func=lambda s: False,
+        interval=5
+    )
+
+    assert result == "done"
+    assert [c.args[0] for c in sleep.await_args_list] == [7.0, 1.0]
+
+def test_dump_nonnull_matches_model_dump():
+    """The serializer-free dump agrees with model_dump(exclude_none=True), extras and nesting included."""
+    from genpulse.clients.dashscope.schemas import DashScopeImageEditParams, DashScopeVideoParams
+    edit = DashScopeImageEditParams.model_validate({
+        "model": "qwen-image-edit-max",
+        "messages": [{"role": "user", "content": [{"image": "https://x/a.png"}, {"text": "make it blue"}]}],
+        "seed": 7,
+    })
+    video = DashScopeVideoParams(model="wan2.5-t2v-preview", prompt="a cat", duration=5)
+
+    for request in (edit, video):
+        assert BaseClient._dump_nonnull(request) == request.model_dump(exclude_none=True)
+
+@pytest.mark.asyncio
+async def test_poll_tasks_shares_one_schedule(mocker):
+    """Unfinished tasks are queried together each round; errors only retry that task."""
+    sleep = mocker.patch("genpulse.clients.base.asyncio.sleep", new=AsyncMock())
+    mocker.patch("genpulse.clients.base.random.uniform", return_value=0)
+    statuses = {
+        "a": iter(["done"]),
+        "b": iter([ConnectionError("reset"), "running", "failed"]),
+    }
+
+    async def get_status(task_id):
+        status = next(statuses[task_id])
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+    results = await BaseClient().poll_tasks(
+        ["a", "b"],
+        get_status_func=get_status,
+        check_success_func=lambda s: s == "done",
+        check_failed_func=lambda s: s == "failed",
+        interval=5
+    )
+
+    assert results == {"a": "done", "b": "failed"}
+    assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0]
+
+@pytest.mark.asyncio
+async def test_request_does_not_mutate_cached_headers(mocker):
+    """Per-request headers extend a copy; the provider's cached header dict is reused untouched."""
+    cached = {"Authorization": "Bearer t"}
+
+    class Client(BaseClient):
+        def _get_headers(self):
+            return cached
+
+    http = mocker.patch.object(BaseClient, "_get_http").return_value
+    http.request = AsyncMock(return_value=httpx.Response(200, content=b'{"ok": true}', request=httpx.Request("POST", "https://x")))
+    client = Client("https://x")
+
+    await client._request("POST", "/a", json={"k": 1}, headers={"X-Trace": "1"})
+    await client._request("GET", "/b")
+
+    assert cached == {"Authorization": "Bearer t"}
+    first, second = http.request.await_args_list
+    assert first.kwargs["headers"] == {"Authorization": "Bearer t", "X-Trace": "1", "Content-Type": "application/json"}
+    assert second.kwargs["headers"] is cached
+
+@pytest.mark.asyncio
+async def test_poll_task_gives_up_on_errors(mocker):
+    """Auth errors fail at once; other errors are retried up to max_consecutive_errors."""
+    mocker.patch("genpulse.clients.base.asyncio.sleep", new=AsyncMock())
+    request = httpx.Request("GET", "https://example.com/task/t1")
+    unauthorized = httpx.HTTPStatusError(
+        "401", request=request, response=httpx.Response(401, request=request)
+    )
+    kwargs = dict(check_success_func=lambda s: s == "done", check_failed_func=lambda s: False)
+
+    fetch = AsyncMock(side_effect=unauthorized)
+    with pytest.raises(httpx.HTTPStatusError):
+        await BaseClient().poll_task("t1", get_status_func=fetch, **kwargs)
+    assert fetch.await_count == 1
+
+    fetch = AsyncMock(side_effect=ConnectionError("reset"))
+    with pytest.raises(ConnectionError):
+        await BaseClient().poll_task("t1", get_status_func=fetch, max_consecutive_errors=3, **kwargs)
+    assert fetch.await_count == 3
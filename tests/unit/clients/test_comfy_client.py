@@ -12,7 +12,7 @@ async def test_queue_prompt():
     
     with patch("httpx.AsyncClient.post") as mock_post:
         mock_response = MagicMock()
-        mock_response.json.return_value = {"prompt_id": expected_prompt_id}
+        mock_response.content = json.dumps({"prompt_id": expected_prompt_id}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_post.return_value = mock_response
         
@@ -21,8 +21,9 @@ async def test_queue_prompt():
         assert prompt_id == expected_prompt_id
         mock_post.assert_called_once()
         args, kwargs = mock_post.call_args
-        assert kwargs["json"]["prompt"] == prompt
-        assert "client_id" in kwargs["json"]
+        body = json.loads(kwargs["content"])
+        assert body["prompt"] == prompt
+        assert "client_id" in body
 
 @pytest.mark.asyncio
 async def test_wait_for_completion():
@@ -61,3 +62,27 @@ async def test_wait_for_completion():
                 assert len(images) == 1
                 assert images[0] == b"fake_image_bytes"
                 client.get_image.assert_called_once_with("out1.png", "", "output")
+
+@pytest.mark.parametrize("base_url, ws_prefix", [
+    ("http://127.0.0.1:8188", "ws://127.0.0.1:8188/ws?"),
+    ("https://comfy.example.com/comfy/api/", "wss://comfy.example.com/comfy/api/ws?"),
+    ("localhost:8188", "ws://localhost:8188/ws?"),
+])
+def test_websocket_url(base_url, ws_prefix):
+    client = ComfyClient(base_url)
+    assert client._ws_url == f"{ws_prefix}clientId={client.client_id}"
+
+@pytest.mark.asyncio
+async def test_wait_for_completion_times_out():
+    """A prompt whose completion frame never arrives fails instead of hanging."""
+    import asyncio
+    client = ComfyClient("http://127.0.0.1:8188")
+
+    async def never():
+        await asyncio.sleep(3600)
+    mock_ws = AsyncMock()
+    mock_ws.recv.side_effect = never
+
+    with patch("websockets.connect", return_value=MagicMock(__aenter__=AsyncMock(return_value=mock_ws))):
+        with pytest.raises(TimeoutError):
+            await client.wait_for_completion("prompt_123", timeout=0.05)
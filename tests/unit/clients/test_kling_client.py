@@ -0,0 +1,23 @@
+from genpulse.clients.kling.client import _construct_status
+from genpulse.clients.kling.schemas import KlingStatusResponse
+
+def test_construct_status_matches_validation():
+    """Test that the unvalidated poll response equals the validated model."""
+    data = {
+        "code": 0,
+        "message": "SUCCEED",
+        "request_id": "r1",
+        "data": {
+            "task_id": "t1",
+            "task_status": "succeed",
+            "task_info": {"external_task_id": "ext"},
+            "video_info": {"video_url": "https://x/v.mp4"},
+            "created_at": 1,
+            "updated_at": 2,
+        },
+    }
+
+    response = _construct_status(data)
+
+    assert response == KlingStatusResponse.model_validate(data)
+    assert response.is_succeeded
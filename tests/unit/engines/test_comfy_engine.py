@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import AsyncMock
 from genpulse.engines.comfy_engine import ComfyEngine
 from genpulse.types import TaskContext
+from genpulse import config
 
 @pytest.fixture
 def mock_storage(mocker):
@@ -23,6 +24,7 @@ def mock_comfy_client(mocker):
     mock_instance.wait_for_completion.return_value = [b"image1", b"image2"]
     
     mock_cls = mocker.patch("genpulse.engines.comfy_engine.ComfyClient", return_value=mock_instance)
+    mocker.patch.dict(ComfyEngine._pools, clear=True)
     return mock_instance
 
 @pytest.fixture
@@ -61,8 +63,27 @@ async def test_comfy_engine_execute_success(mock_comfy_client, mock_storage, tas
     
     # Verify Interactions
     mock_comfy_client.queue_prompt.assert_called_once_with({"node": "data"})
-    mock_comfy_client.wait_for_completion.assert_called_once_with("prompt_123")
+    mock_comfy_client.wait_for_completion.assert_called_once_with("prompt_123", timeout=config.COMFY_WAIT_TIMEOUT)
     assert mock_storage.upload.call_count == 2
     
     # Verify Status Updates (Processing -> Queuing -> Waiting -> Uploading)
     assert task_context.update_status.call_count >= 3
+
+@pytest.mark.asyncio
+async def test_comfy_engine_client_per_task_shares_pool(mocker):
+    """Each task gets its own client_id (ComfyUI keeps one socket per id) over one HTTP pool."""
+    mocker.patch.dict(ComfyEngine._pools, clear=True)
+
+    first = ComfyEngine._get_client("http://test:8188")
+    second = ComfyEngine._get_client("http://test:8188")
+    other = ComfyEngine._get_client("http://other:8188")
+
+    assert first.client_id != second.client_id
+    assert first.http is second.http
+    assert other.http is not first.http
+    # Closing a per-task client leaves the shared pool open
+    pool = second.http
+    await first.aclose()
+    assert not pool.is_closed
+    await ComfyEngine.close_pools()
+    assert pool.is_closed and not ComfyEngine._pools
@@ -2,6 +2,7 @@
 Unit tests for DiffusersEngine logic (via Handler integration).
 """
 import pytest
+import asyncio
 from unittest.mock import AsyncMock
 from genpulse.handlers.image import TextToImageHandler
 from genpulse.types import TaskContext
@@ -57,3 +58,146 @@ async def test_diffusers_engine_mock_flow(mock_storage, task_context):
     
     # Verify status updates
     assert task_context.update_status.call_count >= 1
+
+@pytest.mark.asyncio
+async def test_diffusers_engine_webp_output(mock_storage, task_context):
+    """Test that params["format"] selects the encoder and content type."""
+    handler = TextToImageHandler()
+    task_data = {
+        "task_id": "task_diff_123",
+        "task_type": "text-to-image",
+        "params": {
+            "provider": "diffusers",
+            "model_id": "mock",
+            "prompt": "test prompt",
+            "format": "webp",
+        }
+    }
+
+    await handler.execute(task_data, task_context)
+
+    path, buf = mock_storage.upload.call_args[0]
+    assert path.endswith(".webp")
+    assert mock_storage.upload.call_args[1]["content_type"] == "image/webp"
+    assert buf.read(12)[8:] == b"WEBP"
+
+class FakePipeline:
+    """Stands in for a diffusers pipeline: runs the step callback and returns images."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, prompt, num_inference_steps, callback_on_step_end, **kwargs):
+        from PIL import Image
+        self.calls.append({"prompt": prompt, "steps": num_inference_steps, **kwargs})
+        for step in range(num_inference_steps):
+            callback_on_step_end(self, step, None, {})
+        count = kwargs.get("num_images_per_prompt", 1)
+        return type("Output", (), {"images": [Image.new("RGB", (8, 8)) for _ in range(count)]})()
+
+@pytest.fixture
+def fake_pipeline(mocker):
+    """Replace model loading with a FakePipeline and start from an empty cache."""
+    from genpulse.engines import diffusers_engine
+    pipe = FakePipeline()
+    mocker.patch.dict(diffusers_engine._PIPELINE_CACHE, clear=True)
+    load = mocker.patch.object(diffusers_engine, "_load_pipeline", return_value=pipe)
+    return pipe, load
+
+@pytest.mark.asyncio
+async def test_diffusers_engine_real_path_uses_pipeline_cache(mock_storage, task_context, fake_pipeline):
+    """Test that real model ids run through the cached pipeline and upload every image."""
+    from genpulse.engines.diffusers_engine import DiffusersEngine
+    pipe, load = fake_pipeline
+    task_data = {
+        "task_id": "task_diff_123",
+        "params": {
+            "model_id": "Org/Model-XL",
+            "prompt": "test prompt",
+            "device": "cpu",
+            "precision": "bf16",
+            "steps": 4,
+            "num_images_per_prompt": 2,
+        }
+    }
+    engine = DiffusersEngine()
+
+    first = await engine.execute(task_data, task_context)
+    await engine.execute(task_data, task_context)
+
+    # Loaded once under its exact (case-sensitive) id, reused on the second run
+    load.assert_called_once_with("Org/Model-XL", "bf16", "cpu")
+    assert len(pipe.calls) == 2
+    assert pipe.calls[0]["steps"] == 4 and pipe.calls[0]["num_images_per_prompt"] == 2
+    assert first == {"images": ["http://mock/asset.png"] * 2, "model": "Org/Model-XL", "provider": "diffusers"}
+    assert mock_storage.upload.call_count == 4
+    # Denoising progress reached the task status between start and finalize
+    progresses = [c[0][1] for c in task_context.update_status.call_args_list]
+    assert 85 in progresses and progresses[-1] == 90
+
+@pytest.mark.asyncio
+async def test_diffusers_engine_rejects_unknown_precision(mock_storage, task_context, fake_pipeline):
+    """Test that an unsupported precision fails before any model is loaded."""
+    from genpulse.engines.diffusers_engine import DiffusersEngine
+    from genpulse.types import EngineError
+    _, load = fake_pipeline
+    task_data = {"params": {"model_id": "org/model", "prompt": "p", "device": "cpu", "precision": "int3"}}
+
+    with pytest.raises(EngineError, match="Unsupported precision"):
+        await DiffusersEngine().execute(task_data, task_context)
+    load.assert_not_called()
+
+@pytest.mark.parametrize("capability, has_torchao, expected", [
+    ((9, 0), True, "fp8"),
+    ((8, 6), True, "int8"),
+    ((9, 0), False, "bf16"),
+    ((8, 6), False, "bf16"),
+    ((7, 5), False, "fp16"),
+])
+def test_default_precision_needs_torchao_for_quantized_modes(mocker, capability, has_torchao, expected):
+    """Test that Ampere+ only defaults to a torchao precision when torchao is importable."""
+    from unittest.mock import MagicMock
+    from genpulse.engines import diffusers_engine
+    torch = MagicMock()
+    torch.cuda.get_device_capability.return_value = capability
+    mocker.patch.dict("sys.modules", {"torch": torch})
+    mocker.patch("importlib.util.find_spec", return_value=object() if has_torchao else None)
+
+    assert diffusers_engine._default_precision("cuda:0") == expected
+    assert diffusers_engine._default_precision("cpu") == "fp32"
+
+@pytest.mark.asyncio
+async def test_diffusers_engine_quantized_precision_requires_torchao(mock_storage, task_context, fake_pipeline, mocker):
+    """Test that asking for int8 without torchao fails with a clear error instead of at load time."""
+    from genpulse.engines.diffusers_engine import DiffusersEngine
+    from genpulse.types import EngineError
+    _, load = fake_pipeline
+    mocker.patch("importlib.util.find_spec", return_value=None)
+    task_data = {"params": {"model_id": "org/model", "prompt": "p", "device": "cpu", "precision": "int8"}}
+
+    with pytest.raises(EngineError, match="requires the torchao package"):
+        await DiffusersEngine().execute(task_data, task_context)
+    load.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_diffusers_engine_serializes_work_per_device(mock_storage, task_context, fake_pipeline, mocker):
+    """Test that loading and inference for a device run on its single dedicated thread."""
+    import threading
+    from genpulse.engines import diffusers_engine
+    pipe, load = fake_pipeline
+    mocker.patch.dict(diffusers_engine._DEVICE_EXECUTORS, clear=True)
+    threads = []
+    load.side_effect = lambda *args: threads.append(threading.current_thread().name) or pipe
+    generate = diffusers_engine._generate
+    mocker.patch.object(
+        diffusers_engine, "_generate",
+        side_effect=lambda *args: threads.append(threading.current_thread().name) or generate(*args)
+    )
+    task_data = {"params": {"model_id": "org/model", "prompt": "p", "device": "cpu", "precision": "fp32", "steps": 2}}
+
+    await asyncio.gather(*(diffusers_engine.DiffusersEngine().execute(task_data, task_context) for _ in range(3)))
+
+    assert len(threads) == 4  # one load, three runs
+    assert set(threads) == {threads[0]} and threads[0].startswith("diff-cpu")
+    assert list(diffusers_engine._DEVICE_EXECUTORS) == ["cpu"]
+    diffusers_engine._DEVICE_EXECUTORS["cpu"].shutdown()
@@ -0,0 +1,23 @@
+from genpulse.handlers.base import BaseHandler
+from genpulse.handlers.registry import HandlerRegistry
+
+def test_get_instance_reuses_handler(mocker):
+    """Test that one handler instance is shared per task type and reset on re-register."""
+    mocker.patch.dict(HandlerRegistry._handlers, clear=True)
+    mocker.patch.dict(HandlerRegistry._instances, clear=True)
+
+    @HandlerRegistry.register("unit-test")
+    class FirstHandler(BaseHandler):
+        def validate_params(self, params): return True
+        async def execute(self, task, context): return {}
+
+    first = HandlerRegistry.get_instance("unit-test")
+    assert isinstance(first, FirstHandler)
+    assert HandlerRegistry.get_instance("unit-test") is first
+    assert HandlerRegistry.get_instance("missing") is None
+
+    @HandlerRegistry.register("unit-test")
+    class SecondHandler(FirstHandler):
+        pass
+
+    assert isinstance(HandlerRegistry.get_instance("unit-test"), SecondHandler)
@@ -6,7 +6,7 @@ Note: These tests mock Celery to avoid requiring a running Celery worker.
 import pytest
 import json
 import os
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 # Set MQ_TYPE to celery for these tests
 os.environ["GENPULSE_MQ__TYPE"] = "celery"
@@ -70,3 +70,51 @@ async def test_celery_status_update(mq):
     assert status["status"] == "completed"
     assert status["progress"] == 100
     assert status["result"]["video_url"] == "https://example.com/video.mp4"
+
+
+@pytest.mark.asyncio
+async def test_celery_push_task_priority_queue(mq):
+    """Test that non-normal priorities are routed to their own queue shard."""
+    with patch("genpulse.infra.mq.celery_mq.celery_app.send_task") as mock_send:
+        await mq.push_task("{}", priority="high")
+
+        mock_send.assert_called_once_with(
+            "genpulse.tasks.execute_task",
+            args=["{}"],
+            queue="genpulse_tasks.high"
+        )
+
+
+@pytest.mark.asyncio
+async def test_celery_status_read_is_cached(mq):
+    """Test that repeated polls within the cache window hit Redis once."""
+    mq.redis_client = AsyncMock()
+    mq.redis_client.get.return_value = b'{"status": "processing", "progress": 40}'
+
+    first = await mq.get_task_status("test-celery-cache")
+    second = await mq.get_task_status("test-celery-cache")
+
+    assert first == second == {"status": "processing", "progress": 40}
+    mq.redis_client.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_celery_ping_does_not_block_loop(mq):
+    """Test that a slow broker check runs off the event loop."""
+    import asyncio
+    import threading
+    started = threading.Event()
+
+    def slow_check():
+        started.set()
+        threading.Event().wait(0.2)
+
+    with patch.object(CeleryMQ, "_check_broker", side_effect=slow_check):
+        ping = asyncio.create_task(mq.ping())
+        # The loop stays free while the broker check is still running
+        await asyncio.to_thread(started.wait, 1)
+        assert not ping.done()
+        assert await ping is True
+
+    with patch.object(CeleryMQ, "_check_broker", side_effect=ConnectionError("down")):
+        assert await mq.ping() is False
@@ -0,0 +1,60 @@
+import asyncio
+import orjson
+import pytest
+from unittest.mock import AsyncMock
+from genpulse.infra.mq.events import TaskEventHub
+
+
+@pytest.mark.asyncio
+async def test_event_hub_fans_out_to_subscribers():
+    """Test that stream entries reach only the queues subscribed to that task."""
+    client = AsyncMock()
+    client.xrevrange.return_value = []
+
+    async def fake_xread(streams, count, block):
+        if fake_xread.calls == 0:
+            fake_xread.calls += 1
+            return [["events", [
+                (b"1-0", {b"task_id": b"task-a", b"data": orjson.dumps({"status": "completed"})}),
+                (b"2-0", {b"task_id": b"task-b", b"data": orjson.dumps({"status": "failed"})}),
+            ]]]
+        await asyncio.sleep(3600)
+    fake_xread.calls = 0
+    client.xread.side_effect = fake_xread
+
+    hub = TaskEventHub(client, "events")
+    queue = await hub.subscribe("task-a")
+
+    event = await asyncio.wait_for(queue.get(), timeout=1)
+    assert event == {"status": "completed"}
+    assert queue.empty()
+    # Reader starts from the stream head captured at subscribe time
+    assert client.xread.call_args_list[0][0][0] == {"events": b"0-0"}
+
+    hub.unsubscribe("task-a", queue)
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_event_hub_starts_one_reader_for_concurrent_subscribers():
+    """Test that subscribers racing on start-up share a single reader."""
+    client = AsyncMock()
+
+    async def slow_xrevrange(key, count):
+        await asyncio.sleep(0.01)
+        return []
+    client.xrevrange.side_effect = slow_xrevrange
+
+    async def idle_xread(streams, count, block):
+        await asyncio.sleep(3600)
+    client.xread.side_effect = idle_xread
+
+    hub = TaskEventHub(client, "events")
+    await asyncio.gather(hub.subscribe("task-a"), hub.subscribe("task-b"), hub.subscribe("task-a"))
+    await asyncio.sleep(0)
+
+    client.xrevrange.assert_awaited_once()
+    assert client.xread.await_count == 1
+    reader = hub._reader
+    await hub.close()
+    assert reader.cancelled()
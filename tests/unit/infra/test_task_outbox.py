@@ -0,0 +1,138 @@
+import asyncio
+import orjson
+import pytest
+from unittest.mock import AsyncMock
+from genpulse.infra.database.outbox import TaskOutbox
+from genpulse.infra.database.batcher import TaskInsertBatcher
+
+@pytest.mark.asyncio
+async def test_outbox_parks_failed_insert(mocker):
+    """Test that a failed write-behind insert is pushed onto the outbox list."""
+    mocker.patch("redis.asyncio.from_url")
+    create = mocker.patch(
+        "genpulse.infra.database.manager.DBManager.create_tasks",
+        new=AsyncMock(side_effect=ConnectionError("db down"))
+    )
+    outbox = TaskOutbox()
+    outbox.client = AsyncMock()
+
+    await outbox._persist({"task_id": "t1", "task_type": "text-to-video", "params": {}})
+
+    create.assert_awaited_once()
+    await outbox.batcher.close()
+    key, raw = outbox.client.lpush.call_args[0]
+    assert key == outbox.key
+    assert orjson.loads(raw)["task_id"] == "t1"
+
+@pytest.mark.asyncio
+async def test_outbox_drain_persists_batch(mocker):
+    """Test that drain pops parked rows in one call and inserts them together."""
+    mocker.patch("redis.asyncio.from_url")
+    create = mocker.patch(
+        "genpulse.infra.database.manager.DBManager.create_tasks",
+        new=AsyncMock()
+    )
+    outbox = TaskOutbox()
+    outbox.client = AsyncMock()
+    first = orjson.dumps({"task_id": "t1", "task_type": "x", "params": {}})
+    second = orjson.dumps({"task_id": "t2", "task_type": "x", "params": {}})
+    outbox.client.rpop.return_value = [first, second]
+
+    assert await outbox.drain() == 2
+    outbox.client.rpop.assert_awaited_once_with(outbox.key, 100)
+    create.assert_awaited_once()
+    assert [row["task_id"] for row in create.call_args[0][0]] == ["t1", "t2"]
+    await outbox.batcher.close()
+
+@pytest.mark.asyncio
+async def test_outbox_drain_requeues_on_failure(mocker):
+    """Test that rows that still fail are pushed back oldest-first."""
+    mocker.patch("redis.asyncio.from_url")
+    mocker.patch(
+        "genpulse.infra.database.manager.DBManager.create_tasks",
+        new=AsyncMock(side_effect=ConnectionError("db down"))
+    )
+    outbox = TaskOutbox()
+    outbox.client = AsyncMock()
+    first = orjson.dumps({"task_id": "t1", "task_type": "x", "params": {}})
+    second = orjson.dumps({"task_id": "t2", "task_type": "x", "params": {}})
+    outbox.client.rpop.return_value = [first, second]
+
+    assert await outbox.drain() == 0
+    outbox.client.rpush.assert_awaited_once_with(outbox.key, second, first)
+    await outbox.batcher.close()
+
+@pytest.mark.asyncio
+async def test_outbox_run_backs_off_and_stops(mocker):
+    """Test that an idle drainer sleeps longer each round and exits on stop()."""
+    mocker.patch("redis.asyncio.from_url")
+    outbox = TaskOutbox()
+    outbox.client = AsyncMock()
+    outbox.client.rpop.return_value = None
+    drainer = asyncio.create_task(outbox.run(interval=0.01, max_interval=0.04))
+
+    await asyncio.sleep(0.1)
+    outbox.stop()
+    await asyncio.wait_for(drainer, 1)
+
+    # 0.02 + 0.04 + 0.04 ... instead of a drain every 0.01
+    assert 2 <= outbox.client.rpop.await_count <= 5
+    await outbox.batcher.close()
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_inserts(mocker):
+    """Test that rows submitted together are written with one INSERT."""
+    create = mocker.patch(
+        "genpulse.infra.database.manager.DBManager.create_tasks",
+        new=AsyncMock()
+    )
+    batcher = TaskInsertBatcher(max_batch=10, max_delay=0.05)
+    rows = [{"task_id": f"t{i}", "task_type": "x", "params": {}} for i in range(3)]
+
+    await asyncio.gather(*(batcher.submit(row) for row in rows))
+
+    create.assert_awaited_once_with(rows)
+    await batcher.close()
+
+@pytest.mark.asyncio
+async def test_batcher_isolates_bad_row(mocker):
+    """Test that a failing batch is retried row by row so only the bad row fails."""
+    async def create_tasks(rows):
+        if any(row["task_type"] == "bad" for row in rows):
+            raise ValueError("value too long")
+    create = mocker.patch(
+        "genpulse.infra.database.manager.DBManager.create_tasks",
+        new=AsyncMock(side_effect=create_tasks)
+    )
+    batcher = TaskInsertBatcher(max_batch=10, max_delay=0.05)
+    rows = [{"task_id": f"t{i}", "task_type": "x", "params": {}} for i in range(3)]
+    rows[1]["task_type"] = "bad"
+
+    results = await asyncio.gather(*(batcher.submit(row) for row in rows), return_exceptions=True)
+
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], ValueError)
+    # One batched attempt, then one retry per row
+    assert create.await_count == 4
+    await batcher.close()
+
+@pytest.mark.asyncio
+async def test_outbox_is_usable_after_close(mocker):
+    """Test that a second lifespan gets a fresh outbox whose drainer actually runs."""
+    from genpulse.infra.database import outbox as outbox_module
+    mocker.patch("redis.asyncio.from_url", side_effect=lambda *a, **k: AsyncMock())
+    mocker.patch.object(outbox_module, "_outbox", None)
+
+    first = outbox_module.get_outbox()
+    first.stop()
+    await first.close()
+
+    second = outbox_module.get_outbox()
+    assert second is not first
+    second.client.rpop.return_value = None
+    drainer = asyncio.create_task(second.run(interval=0.01))
+    await asyncio.sleep(0.03)
+    assert second.client.rpop.await_count >= 1
+    second.stop()
+    await asyncio.wait_for(drainer, 1)
+    await second.close()
@@ -0,0 +1,25 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from genpulse.routers import task as task_router
+from pydantic import TypeAdapter
+from genpulse.schemas.request import TaskRequest
+
+@pytest.mark.asyncio
+async def test_create_task_records_pending_before_push(mocker):
+    """Test that the pending status is cached before the task reaches a worker."""
+    calls = []
+    mq = MagicMock()
+    mq.update_task_status = AsyncMock(side_effect=lambda *a, **k: calls.append("status"))
+    mq.push_task = AsyncMock(side_effect=lambda *a, **k: calls.append("push"))
+    mocker.patch.object(task_router, "mq", mq)
+    outbox = mocker.patch.object(task_router, "get_outbox").return_value
+
+    req = TypeAdapter(TaskRequest).validate_python(
+        {"task_type": "text-to-image", "provider": "mock", "params": {"prompt": "a cat"}}
+    )
+    resp = await task_router.create_task(req)
+
+    assert resp["status"] == "pending"
+    mq.update_task_status.assert_awaited_once_with(resp["task_id"], "pending")
+    assert calls == ["status", "push"]
+    outbox.persist.assert_called_once()
@@ -47,3 +47,22 @@ def test_apply_params():
     assert new_wf["3"]["inputs"]["text"] == "hello world"
     # Original should not be modified
     assert wf["3"]["inputs"]["text"] == "default"
+
+def test_apply_params_shares_untouched_nodes():
+    wf = {
+        "3": {
+            "class_type": "CLIPTextEncode",
+            "_meta": {"title": "INPUT_prompt"},
+            "inputs": {"text": "default"}
+        },
+        "4": {
+            "class_type": "VAEDecode",
+            "inputs": {"samples": ["3", 0]}
+        }
+    }
+    schema = parse_workflow_template(wf)
+
+    new_wf = apply_params(wf, {"prompt": "hello"}, schema)
+    assert new_wf["3"] is not wf["3"]
+    # Nodes without injected values are not copied
+    assert new_wf["4"] is wf["4"]
@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from genpulse.types import TaskContext
+from genpulse.utils.progress import ProgressReporter
+
+@pytest.mark.asyncio
+async def test_progress_reporter_keeps_latest_value():
+    """Values reported while a write is in flight collapse to the most recent one."""
+    release = asyncio.Event()
+    writes = []
+
+    async def slow_update(status, progress, result):
+        writes.append(progress)
+        await release.wait()
+
+    context = TaskContext(task_id="t1", update_status=AsyncMock(side_effect=slow_update))
+    async with ProgressReporter(context) as progress:
+        progress.report(10)
+        await asyncio.sleep(0)  # Consumer picks up 10 and blocks on the write
+        for p in (20, 30, 40):
+            progress.report(p)
+        release.set()
+        await asyncio.sleep(0.01)
+
+    assert writes == [10, 40]
+
+@pytest.mark.asyncio
+async def test_progress_reporter_flushes_on_exit():
+    """The last reported value is written when the reporter closes."""
+    context = TaskContext(task_id="t1", update_status=AsyncMock())
+    async with ProgressReporter(context) as progress:
+        progress.report(75, info="Almost")
+
+    context.update_status.assert_awaited_with("processing", 75, {"info": "Almost"})
+
+@pytest.mark.asyncio
+async def test_step_callback_reports_only_on_change():
+    """The step callback skips loop hand-offs when the percentage doesn't move."""
+    context = TaskContext(task_id="t1", update_status=AsyncMock())
+    async with ProgressReporter(context) as progress:
+        progress.report_threadsafe = reported = MagicMock()
+        callback = progress.step_callback(total_steps=200, start=10, span=75)
+        for step in range(200):
+            assert callback(None, step, None, {"latents": 1}) == {"latents": 1}
+
+    values = [c.args[0] for c in reported.call_args_list]
+    assert values == sorted(set(values))
+    assert values[-1] == 85
+    assert len(values) < 200